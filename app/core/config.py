@@ -77,6 +77,10 @@ class Settings(BaseSettings):
         default=False,
         validation_alias=AliasChoices("NYA_DEV_LOGIN_ENABLED", "DEV_LOGIN_ENABLED"),
     )
+    static_reload: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("NYA_STATIC_RELOAD", "STATIC_RELOAD"),
+    )
     allow_all_domains: bool = Field(
         default=False,
         validation_alias=AliasChoices("NYA_ALLOW_ALL_DOMAINS", "ALLOW_ALL_DOMAINS"),
@@ -114,6 +118,99 @@ class Settings(BaseSettings):
         default=False,
         validation_alias=AliasChoices("NYA_SMTP_USE_STARTTLS", "SMTP_USE_STARTTLS"),
     )
+    smtp_transport: str = Field(
+        default="auto",
+        validation_alias=AliasChoices("NYA_SMTP_TRANSPORT", "SMTP_TRANSPORT"),
+    )
+    smtp_timeout_seconds: float = Field(
+        default=10.0,
+        validation_alias=AliasChoices("NYA_SMTP_TIMEOUT_SECONDS", "SMTP_TIMEOUT_SECONDS"),
+    )
+    smtp_pool_size: int = Field(
+        default=4,
+        validation_alias=AliasChoices("NYA_SMTP_POOL_SIZE", "SMTP_POOL_SIZE"),
+    )
+    smtp_session_max_messages: int = Field(
+        default=100,
+        validation_alias=AliasChoices("NYA_SMTP_SESSION_MAX_MESSAGES", "SMTP_SESSION_MAX_MESSAGES"),
+    )
+    smtp_session_max_age_seconds: int = Field(
+        default=300,
+        validation_alias=AliasChoices("NYA_SMTP_SESSION_MAX_AGE_SECONDS", "SMTP_SESSION_MAX_AGE_SECONDS"),
+    )
+    user_cache_ttl_seconds: int = Field(
+        default=15,
+        validation_alias=AliasChoices("NYA_USER_CACHE_TTL_SECONDS", "USER_CACHE_TTL_SECONDS"),
+    )
+    user_cache_max_entries: int = Field(
+        default=4096,
+        validation_alias=AliasChoices("NYA_USER_CACHE_MAX_ENTRIES", "USER_CACHE_MAX_ENTRIES"),
+    )
+    notification_digest_window_seconds: int = Field(
+        default=900,
+        validation_alias=AliasChoices("NYA_NOTIFICATION_DIGEST_WINDOW_SECONDS", "NOTIFICATION_DIGEST_WINDOW_SECONDS"),
+    )
+    notification_digest_poll_seconds: int = Field(
+        default=30,
+        validation_alias=AliasChoices("NYA_NOTIFICATION_DIGEST_POLL_SECONDS", "NOTIFICATION_DIGEST_POLL_SECONDS"),
+    )
+    mentor_template_cache_ttl_seconds: int = Field(
+        default=300,
+        validation_alias=AliasChoices("NYA_MENTOR_TEMPLATE_CACHE_TTL_SECONDS", "MENTOR_TEMPLATE_CACHE_TTL_SECONDS"),
+    )
+    stories_cache_ttl_seconds: int = Field(
+        default=30,
+        validation_alias=AliasChoices("NYA_STORIES_CACHE_TTL_SECONDS", "STORIES_CACHE_TTL_SECONDS"),
+    )
+    email_outbox_concurrency: int = Field(
+        default=4,
+        validation_alias=AliasChoices("NYA_EMAIL_OUTBOX_CONCURRENCY", "EMAIL_OUTBOX_CONCURRENCY"),
+    )
+    email_outbox_batch_size: int = Field(
+        default=20,
+        validation_alias=AliasChoices("NYA_EMAIL_OUTBOX_BATCH_SIZE", "EMAIL_OUTBOX_BATCH_SIZE"),
+    )
+    email_outbox_poll_seconds: float = Field(
+        default=5.0,
+        validation_alias=AliasChoices("NYA_EMAIL_OUTBOX_POLL_SECONDS", "EMAIL_OUTBOX_POLL_SECONDS"),
+    )
+    email_outbox_max_attempts: int = Field(
+        default=6,
+        validation_alias=AliasChoices("NYA_EMAIL_OUTBOX_MAX_ATTEMPTS", "EMAIL_OUTBOX_MAX_ATTEMPTS"),
+    )
+    email_outbox_backoff_seconds: int = Field(
+        default=30,
+        validation_alias=AliasChoices("NYA_EMAIL_OUTBOX_BACKOFF_SECONDS", "EMAIL_OUTBOX_BACKOFF_SECONDS"),
+    )
+    email_outbox_lease_seconds: int = Field(
+        default=120,
+        validation_alias=AliasChoices("NYA_EMAIL_OUTBOX_LEASE_SECONDS", "EMAIL_OUTBOX_LEASE_SECONDS"),
+    )
+
+    skill_index_refresh_seconds: int = Field(
+        default=60,
+        validation_alias=AliasChoices("NYA_SKILL_INDEX_REFRESH_SECONDS", "SKILL_INDEX_REFRESH_SECONDS"),
+    )
+    recommendation_refresh_seconds: int = Field(
+        default=300,
+        validation_alias=AliasChoices("NYA_RECOMMENDATION_REFRESH_SECONDS", "RECOMMENDATION_REFRESH_SECONDS"),
+    )
+    recommendation_apply_delay_seconds: float = Field(
+        default=2.0,
+        validation_alias=AliasChoices("NYA_RECOMMENDATION_APPLY_DELAY_SECONDS", "RECOMMENDATION_APPLY_DELAY_SECONDS"),
+    )
+    discovery_cache_ttl_seconds: int = Field(
+        default=30,
+        validation_alias=AliasChoices("NYA_DISCOVERY_CACHE_TTL_SECONDS", "DISCOVERY_CACHE_TTL_SECONDS"),
+    )
+    discovery_cache_max_entries: int = Field(
+        default=512,
+        validation_alias=AliasChoices("NYA_DISCOVERY_CACHE_MAX_ENTRIES", "DISCOVERY_CACHE_MAX_ENTRIES"),
+    )
+    discovery_cache_max_bytes: int = Field(
+        default=8 * 1024 * 1024,
+        validation_alias=AliasChoices("NYA_DISCOVERY_CACHE_MAX_BYTES", "DISCOVERY_CACHE_MAX_BYTES"),
+    )
 
     groq_api_key: str = Field(
         default="",
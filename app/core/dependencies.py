@@ -4,14 +4,14 @@ from typing import Annotated
 
 import jwt
 from bson import ObjectId
-from fastapi import Cookie, Depends
+from fastapi import Cookie, Depends, Response
 
 from app.core.jwt import TokenType, decode_token
-from app.core.security import ACCESS_COOKIE
+from app.core.security import ACCESS_COOKIE, set_access_cookie
 from app.db.client import get_database
+from app.services.onboarding_service import ONBOARDING_CLAIM, OnboardingService
 from app.services.user_service import UserService
 from app.utils.errors import AppError
-from app.utils.profile import is_capstone_profile_complete
 
 
 async def get_db():
@@ -36,11 +36,14 @@ async def get_current_user(
     if not user_id or not ObjectId.is_valid(user_id):
         raise AppError(401, "invalid_token", "Invalid token subject")
 
-    user = await UserService(db).get_user_by_id(user_id)
+    user = await UserService(db).get_cached_user(user_id)
     if not user:
         raise AppError(401, "user_not_found", "User not found")
     if user.get("blocked"):
         raise AppError(403, "user_blocked", "User account is blocked")
+    claims = payload.get(ONBOARDING_CLAIM)
+    if isinstance(claims, dict) and claims.get("av") == user.get("auth_version", 0):
+        user["onboarding"] = claims
     return user
 
 
@@ -50,7 +53,7 @@ async def require_admin(current_user=Depends(get_current_user)):
     return current_user
 
 
-async def require_onboarding_complete(current_user=Depends(get_current_user), db=Depends(get_db)):
+async def require_onboarding_complete(response: Response, current_user=Depends(get_current_user), db=Depends(get_db)):
     if current_user.get("role") == "ADMIN":
         return current_user
 
@@ -58,16 +61,19 @@ async def require_onboarding_complete(current_user=Depends(get_current_user), db
     if not user_id or not ObjectId.is_valid(user_id):
         raise AppError(403, "profile_incomplete", "Complete your profile")
 
-    object_id = ObjectId(user_id)
+    state = current_user.get("onboarding")
+    if state is None:
+        # Missing or revoked claims: read the state once and hand the client a token that carries it.
+        state, token = await OnboardingService(db).issue_access_token(current_user)
+        set_access_cookie(response, token)
+
     if current_user.get("role") == "MENTOR":
-        doc = await db.mentor_profiles.find_one({"user_id": object_id})
-        if not doc:
+        if not state.get("profile_complete"):
             raise AppError(403, "profile_incomplete", "Complete your mentor profile")
-        if not doc.get("approved_by_admin", False):
+        if not state.get("mentor_approved"):
             raise AppError(403, "mentor_pending", "Mentor profile pending approval")
         return current_user
 
-    doc = await db.capstone_profiles.find_one({"user_id": object_id})
-    if not is_capstone_profile_complete(doc):
+    if not state.get("profile_complete"):
         raise AppError(403, "profile_incomplete", "Complete your profile")
     return current_user
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pymongo import ASCENDING, IndexModel
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 
 async def create_indexes(db) -> None:
@@ -8,6 +8,7 @@ async def create_indexes(db) -> None:
         [
             IndexModel([("email", ASCENDING)], unique=True, name="uniq_email"),
             IndexModel([("role", ASCENDING)], name="role_idx"),
+            IndexModel([("name_prefixes", ASCENDING)], name="name_prefixes_idx"),
         ]
     )
 
@@ -16,8 +17,15 @@ async def create_indexes(db) -> None:
             IndexModel([("user_id", ASCENDING)], unique=True, name="uniq_user_id"),
             IndexModel([("skills", ASCENDING)], name="skills_idx"),
             IndexModel([("required_skills", ASCENDING)], name="required_skills_idx"),
+            IndexModel([("skills_norm", ASCENDING)], name="skills_norm_idx"),
+            IndexModel([("required_skills_norm", ASCENDING)], name="required_skills_norm_idx"),
             IndexModel([("looking_for", ASCENDING)], name="looking_for_idx"),
             IndexModel([("mentor_assigned", ASCENDING)], name="mentor_assigned_idx"),
+            IndexModel([("discoverable", ASCENDING), ("user_id", ASCENDING)], name="discoverable_user_idx"),
+            IndexModel(
+                [("discoverable", ASCENDING), ("looking_for", ASCENDING), ("user_id", ASCENDING)],
+                name="discoverable_looking_for_idx",
+            ),
         ]
     )
 
@@ -35,5 +43,32 @@ async def create_indexes(db) -> None:
             IndexModel([("to_user_id", ASCENDING), ("status", ASCENDING)], name="incoming_status_idx"),
             IndexModel([("from_user_id", ASCENDING), ("status", ASCENDING)], name="outgoing_status_idx"),
             IndexModel([("type", ASCENDING)], name="type_idx"),
+            IndexModel(
+                [("to_user_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+                name="incoming_created_idx",
+            ),
+            IndexModel(
+                [("from_user_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+                name="outgoing_created_idx",
+            ),
+        ]
+    )
+
+    await db.mentor_email_templates.create_indexes(
+        [
+            IndexModel([("mentor_id", ASCENDING), ("template_id", ASCENDING)], name="mentor_template_idx"),
+        ]
+    )
+
+    await db.email_outbox.create_indexes(
+        [
+            IndexModel([("status", ASCENDING), ("next_attempt_at", ASCENDING)], name="status_next_attempt_idx"),
+        ]
+    )
+
+    await db.notification_digest_items.create_indexes(
+        [
+            IndexModel([("recipient_id", ASCENDING), ("flush_id", ASCENDING)], name="recipient_flush_idx"),
+            IndexModel([("flush_id", ASCENDING), ("created_at", ASCENDING)], name="flush_created_idx"),
         ]
     )
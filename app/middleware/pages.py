@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, RedirectResponse, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.dependencies import get_current_user
+from app.core.security import ACCESS_COOKIE, set_access_cookie
+from app.db.client import get_database
+from app.services.onboarding_service import OnboardingService
+from app.utils.assets import PRIVATE_CACHE, AssetManifest
+from app.utils.errors import AppError
+
+# gate: "public" serves the file as-is, "session" needs a login, "complete" also needs finished onboarding,
+# "mentor_pending" is only for mentors whose application is still waiting on an admin.
+# role: only that role may open the page (others go to /dashboard).
+# role_redirects: after the gate passes, send these roles elsewhere instead of serving the file.
+PAGES: dict[str, dict] = {
+    "/": {"file": "landing.html", "gate": "public"},
+    "/landing": {"file": "landing.html", "gate": "public"},
+    "/authentication": {"file": "authentication.html", "gate": "public"},
+    "/onboarding/role": {"file": "role_selection.html", "gate": "public"},
+    "/main_dashboard": {"file": "main_dashboard.html", "gate": "public"},
+    "/profile/setup": {"file": "profile_setup.html", "gate": "public"},
+    "/mentor/setup": {"file": "mentor_setup.html", "gate": "public"},
+    "/mentor_request": {"file": "mentor_request.html", "gate": "public"},
+    "/transition": {"file": "transition.html", "gate": "public"},
+    "/valentines": {"file": "valentines.html", "gate": "public"},
+    "/valentines/yes": {"file": "valentines_yes.html", "gate": "public"},
+    "/admin/mentors": {"file": "admin_mentors.html", "gate": "public"},
+    "/admin/users": {"file": "admin_users.html", "gate": "public"},
+    "/admin/emails": {"file": "admin_emails.html", "gate": "public"},
+    "/admin/stories": {"file": "admin_stories.html", "gate": "public"},
+    "/bex": {"file": "bex.html", "gate": "session"},
+    "/dashboard": {"file": "dashboard.html", "gate": "complete", "role_redirects": {"MENTOR": "/mentor/dashboard"}},
+    "/profile": {"file": "profile_view.html", "gate": "complete"},
+    "/mentors": {"file": "mentors.html", "gate": "complete"},
+    "/mentors/request": {"file": "mentor_request.html", "gate": "complete"},
+    "/hackathons": {"file": "hackathons.html", "gate": "complete"},
+    "/scrape": {"file": "scrape.html", "gate": "complete"},
+    "/requests": {"file": "notifs_request.html", "gate": "complete"},
+    "/requests/new": {"file": "request_message.html", "gate": "complete"},
+    "/mentor/dashboard": {"file": "mentor_dashboard.html", "gate": "complete", "role": "MENTOR"},
+    "/mentor_dashboard": {"file": "mentor_dashboard.html", "gate": "complete", "role": "MENTOR"},
+    "/mentor/emails": {"file": "mentor_emails.html", "gate": "complete", "role": "MENTOR"},
+    "/mentor/pending": {"file": "mentor_pending.html", "gate": "mentor_pending", "role": "MENTOR"},
+}
+
+
+class PageMiddleware:
+    # Serves the HTML pages in PAGES, resolving the session and onboarding stage once per request.
+    def __init__(self, app: ASGIApp, manifest: AssetManifest) -> None:
+        self.app = app
+        self.manifest = manifest
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        entry = PAGES.get(scope.get("path", "")) if scope["type"] == "http" and scope["method"] == "GET" else None
+        if entry is None:
+            await self.app(scope, receive, send)
+            return
+        response = await self._respond(Request(scope), entry)
+        await response(scope, receive, send)
+
+    async def _respond(self, request: Request, entry: dict) -> Response:
+        if entry["gate"] == "public":
+            return self._page(request, entry)
+        db = get_database()
+        try:
+            user = await get_current_user(request.cookies.get(ACCESS_COOKIE), db)
+        except AppError:
+            return RedirectResponse(url="/authentication")
+        if entry["gate"] == "session":
+            return self._page(request, entry)
+
+        role = user.get("role")
+        if entry.get("role") and role != entry["role"]:
+            return RedirectResponse(url="/dashboard")
+
+        reissued = None
+        state = user.get("onboarding")
+        if state is None and role != "ADMIN":
+            state, reissued = await OnboardingService(db).issue_access_token(user)
+
+        if entry["gate"] == "mentor_pending":
+            response = self._mentor_pending(request, entry, state)
+        else:
+            response = self._stage_redirect(user, state)
+            if response is None and role in entry.get("role_redirects", {}):
+                response = RedirectResponse(url=entry["role_redirects"][role])
+            if response is None:
+                response = self._page(request, entry)
+        if reissued:
+            # Never let a shared cache keep a response that carries a token.
+            response.headers["Cache-Control"] = "no-store"
+            set_access_cookie(response, reissued)
+        return response
+
+    def _stage_redirect(self, user: dict, state: dict | None) -> Response | None:
+        if user.get("role") == "ADMIN":
+            return None
+        if not state["role_selected"]:
+            return RedirectResponse(url="/onboarding/role")
+        if user.get("role") == "MENTOR":
+            if not state["profile_complete"]:
+                return RedirectResponse(url="/mentor/setup")
+            if not state["mentor_approved"]:
+                return RedirectResponse(url="/mentor/pending")
+            return None
+        if not state["profile_complete"]:
+            return RedirectResponse(url="/profile/setup")
+        return None
+
+    def _mentor_pending(self, request: Request, entry: dict, state: dict) -> Response:
+        if not state["profile_complete"]:
+            return RedirectResponse(url="/mentor/setup")
+        if state["mentor_approved"]:
+            return RedirectResponse(url="/mentor/dashboard")
+        return self._page(request, entry)
+
+    def _page(self, request: Request, entry: dict) -> Response:
+        # Gated pages depend on who is asking, so only the browser may keep them.
+        cache_control = None if entry["gate"] == "public" else PRIVATE_CACHE
+        response = self.manifest.respond(request, f"/pages/{entry['file']}", cache_control)
+        return response or PlainTextResponse("Page not found", status_code=404)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends
 
 from app.core.dependencies import require_admin, get_db
-from app.schemas.admin import PendingMentor
+from app.schemas.admin import CacheStats, PendingMentor
 from app.schemas.admin_users import AdminUserSummary, AdminUserUpdate
 from app.schemas.common import MessageResponse
 from app.schemas.email_template import (
@@ -15,6 +15,7 @@ from app.schemas.email_template import (
 )
 from app.schemas.story import StoryResponse, StoryUpdateRequest
 from app.services.admin_user_service import AdminUserService
+from app.services.discovery_service import discovery_cache
 from app.services.email_template_service import EmailTemplateService
 from app.services.mentor_profile_service import MentorProfileService
 from app.services.story_service import StoryService
@@ -53,6 +54,11 @@ async def update_user(user_id: str, payload: AdminUserUpdate, _admin=Depends(req
     return {"message": "updated"}
 
 
+@router.get("/cache/discovery", response_model=CacheStats)
+async def discovery_cache_stats(_admin=Depends(require_admin)):
+    return discovery_cache.stats()
+
+
 @router.get("/email-templates", response_model=list[EmailTemplateSummary])
 async def list_email_templates(_admin=Depends(require_admin)):
     return EmailTemplateService().list_templates()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
 from app.core.dependencies import get_current_user, get_db, require_onboarding_complete
+from app.core.security import set_access_cookie
 from app.schemas.mentor import (
     MentorDetail,
     MentorEmailTemplateDetail,
@@ -16,6 +17,7 @@ from app.schemas.mentor_setup import MentorMeResponse, MentorUpsertRequest
 from app.services.mentor_profile_service import MentorProfileService
 from app.services.mentor_email_template_service import MentorEmailTemplateService
 from app.services.mentor_service import MentorService
+from app.services.onboarding_service import OnboardingService
 from app.utils.errors import AppError
 
 router = APIRouter(prefix="/mentors", tags=["mentors"])
@@ -32,13 +34,14 @@ async def get_my_mentor_profile(current_user=Depends(get_current_user), db=Depen
 @router.post("/me", response_model=MentorMeResponse)
 async def upsert_my_mentor_profile(
     payload: MentorUpsertRequest,
+    response: Response,
     current_user=Depends(get_current_user),
     db=Depends(get_db),
 ):
     if current_user.get("role") != "MENTOR":
         raise AppError(403, "forbidden", "Only mentors can update mentor profile")
     service = MentorProfileService(db)
-    return await service.upsert_my_profile(
+    profile = await service.upsert_my_profile(
         user_id=current_user["id"],
         domain=payload.domain,
         experience_years=payload.experience_years,
@@ -47,6 +50,8 @@ async def upsert_my_mentor_profile(
         bio=payload.bio,
         availability=payload.availability,
     )
+    set_access_cookie(response, await OnboardingService(db).reissue_access_token(current_user["id"]))
+    return profile
 
 
 @router.get("", response_model=list[MentorSummary])
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
 from app.core.dependencies import get_current_user, get_db, require_onboarding_complete
+from app.core.security import set_access_cookie
 from app.schemas.profile import PublicProfileResponse
 from app.schemas.profile_setup import ProfileMeResponse, ProfileUpsertRequest
 from app.services.profile_service import ProfileService
 from app.services.capstone_profile_service import CapstoneProfileService
+from app.services.onboarding_service import OnboardingService
 from app.utils.errors import AppError
 
 router = APIRouter(prefix="/profiles", tags=["profiles"])
@@ -23,13 +25,14 @@ async def get_my_profile(current_user=Depends(get_current_user), db=Depends(get_
 @router.post("/me", response_model=ProfileMeResponse)
 async def upsert_my_profile(
     payload: ProfileUpsertRequest,
+    response: Response,
     current_user=Depends(get_current_user),
     db=Depends(get_db),
 ):
     if current_user.get("role") == "MENTOR":
         raise AppError(403, "forbidden", "Prefects cannot update capstone profile")
     service = CapstoneProfileService(db)
-    return await service.upsert_my_profile(
+    profile = await service.upsert_my_profile(
         user_id=current_user["id"],
         skills=payload.skills,
         required_skills=payload.required_skills,
@@ -38,6 +41,8 @@ async def upsert_my_profile(
         bio=payload.bio,
         availability=payload.availability,
     )
+    set_access_cookie(response, await OnboardingService(db).reissue_access_token(current_user["id"]))
+    return profile
 
 
 @router.get("/{user_id}", response_model=PublicProfileResponse)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
 
 from app.core.dependencies import get_current_user, get_db, require_onboarding_complete
-from app.schemas.request import RequestCreate, RequestListItem, RequestSummary
+from app.schemas.request import RequestCreate, RequestInboxPage, RequestListItem, RequestSummary
 from app.services.request_service import RequestService
 
 router = APIRouter(prefix="/requests", tags=["requests"])
@@ -32,6 +34,32 @@ async def outgoing_requests(current_user=Depends(require_onboarding_complete), d
     return await service.list_outgoing(current_user["id"])
 
 
+@router.get("/incoming/page", response_model=RequestInboxPage)
+async def incoming_requests_page(
+    status: Literal["PENDING", "ACCEPTED", "REJECTED"] | None = None,
+    type: Literal["CAPSTONE", "MENTORSHIP"] | None = None,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = None,
+    current_user=Depends(require_onboarding_complete),
+    db=Depends(get_db),
+):
+    service = RequestService(db)
+    return await service.list_page(current_user["id"], True, status, type, limit, cursor)
+
+
+@router.get("/outgoing/page", response_model=RequestInboxPage)
+async def outgoing_requests_page(
+    status: Literal["PENDING", "ACCEPTED", "REJECTED"] | None = None,
+    type: Literal["CAPSTONE", "MENTORSHIP"] | None = None,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = None,
+    current_user=Depends(require_onboarding_complete),
+    db=Depends(get_db),
+):
+    service = RequestService(db)
+    return await service.list_page(current_user["id"], False, status, type, limit, cursor)
+
+
 @router.post("/{request_id}/accept", response_model=RequestSummary)
 async def accept_request(request_id: str, current_user=Depends(require_onboarding_complete), db=Depends(get_db)):
     service = RequestService(db)
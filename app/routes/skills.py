@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.dependencies import get_current_user, get_db
+from app.schemas.skill import SkillSuggestion
+from app.services.skill_suggester import skill_suggester
+
+router = APIRouter(prefix="/skills", tags=["skills"])
+
+
+@router.get("/suggest", response_model=list[SkillSuggestion])
+async def suggest_skills(
+    q: str = Query(default="", max_length=60),
+    limit: int = Query(default=8, ge=1, le=20),
+    _current_user=Depends(get_current_user),
+    db=Depends(get_db),
+):
+    await skill_suggester.ensure_loaded(db)
+    return skill_suggester.suggest(q, limit)
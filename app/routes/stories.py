@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
 from app.core.dependencies import get_db
 from app.schemas.story import StoryResponse
 from app.services.story_service import StoryService
+from app.utils.assets import if_none_match
 
 router = APIRouter(tags=["stories"])
 
 
 @router.get("/stories", response_model=StoryResponse)
-async def list_stories(db=Depends(get_db)):
-    return await StoryService(db).list_stories()
+async def list_stories(request: Request, response: Response, db=Depends(get_db)):
+    payload, etag = await StoryService(db).get_feed()
+    headers = {"ETag": etag, "Cache-Control": "public, no-cache"}
+    if if_none_match(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return payload
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import re
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
 from app.core.dependencies import get_current_user, get_db, require_onboarding_complete
-from app.schemas.user import CurrentUser, DiscoverUser
+from app.schemas.user import CurrentUser, DiscoverUser, NotificationPreferences
 from app.services.discovery_service import DiscoveryService
 from app.services.user_service import UserService
 
@@ -21,6 +21,7 @@ def _parse_skills(skills: str | None) -> list[str] | None:
 
 @router.get("/discover", response_model=list[DiscoverUser])
 async def discover_users(
+    response: Response,
     skills: str | None = Query(default=None),
     search: str | None = Query(default=None),
     looking_for: str | None = Query(default=None),
@@ -28,11 +29,12 @@ async def discover_users(
     limit: int = Query(default=20, ge=1, le=500),
     page: int = Query(default=1, ge=1),
     pool: bool = Query(default=False),
+    cursor: str | None = Query(default=None),
     current_user=Depends(require_onboarding_complete),
     db=Depends(get_db),
 ):
     service = DiscoveryService(db)
-    return await service.discover_users(
+    result = await service.discover_users(
         current_user_id=current_user["id"],
         skills=_parse_skills(skills),
         search=search,
@@ -41,7 +43,11 @@ async def discover_users(
         limit=limit,
         page=page,
         pool=pool,
+        cursor=cursor,
     )
+    if result["next_cursor"]:
+        response.headers["X-Next-Cursor"] = result["next_cursor"]
+    return result["items"]
 
 
 @router.get("/recommended", response_model=list[DiscoverUser])
@@ -57,3 +63,17 @@ async def recommended_users(
 @router.get("/me", response_model=CurrentUser)
 async def current_user(current_user=Depends(get_current_user), db=Depends(get_db)):
     return await UserService(db).get_session_user(current_user)
+
+
+@router.get("/me/notifications", response_model=NotificationPreferences)
+async def notification_preferences(current_user=Depends(get_current_user), db=Depends(get_db)):
+    return await UserService(db).get_notification_mode(current_user)
+
+
+@router.put("/me/notifications", response_model=NotificationPreferences)
+async def update_notification_preferences(
+    payload: NotificationPreferences,
+    current_user=Depends(get_current_user),
+    db=Depends(get_db),
+):
+    return await UserService(db).set_notification_mode(current_user["id"], payload.mode)
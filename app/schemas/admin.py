@@ -14,3 +14,11 @@ class PendingMentor(BaseModel):
     links: list[str]
     bio: str
     availability: str
+
+
+class CacheStats(BaseModel):
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+    generation: int
@@ -5,3 +5,5 @@ from pydantic import BaseModel
 
 class PublicConfig(BaseModel):
     google_client_id: str
+    # Plain asset URL -> content-hashed URL that is served with an immutable Cache-Control.
+    assets: dict[str, str] = {}
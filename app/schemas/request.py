@@ -26,3 +26,15 @@ class RequestListItem(RequestSummary):
     counterpart_name: str
     counterpart_role: Literal["USER", "MENTOR", "ADMIN"]
     counterpart_email: str | None = None
+
+
+class RequestStatusCounts(BaseModel):
+    PENDING: int = 0
+    ACCEPTED: int = 0
+    REJECTED: int = 0
+
+
+class RequestInboxPage(BaseModel):
+    items: list[RequestListItem]
+    next_cursor: str | None = None
+    counts: RequestStatusCounts
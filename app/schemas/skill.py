@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class SkillSuggestion(BaseModel):
+    name: str
+    count: int
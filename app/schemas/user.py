@@ -24,3 +24,7 @@ class CurrentUser(BaseModel):
     id: str
     name: str
     role: Literal["USER", "MENTOR", "ADMIN"]
+
+
+class NotificationPreferences(BaseModel):
+    mode: Literal["IMMEDIATE", "DIGEST"]
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from bson import ObjectId
 
+from app.services.mentor_email_template_service import mentor_template_overrides
+from app.services.profile_events import mentor_profile_changed, profile_changed
+from app.services.user_service import user_cache
 from app.utils.errors import AppError
 from app.utils.mongo import normalize_id
 
@@ -31,26 +34,27 @@ class AdminUserService:
     async def update_user(self, user_id: str, action: str) -> None:
         if not ObjectId.is_valid(user_id):
             raise AppError(400, "invalid_user_id", "Invalid user id")
+        object_id = ObjectId(user_id)
         if action == "make_admin":
-            await self.db.users.update_one({"_id": ObjectId(user_id)}, {"$set": {"role": "ADMIN"}})
-            return
-        if action == "remove_admin":
-            await self.db.users.update_one({"_id": ObjectId(user_id)}, {"$set": {"role": "USER"}})
-            return
-        if action == "block":
-            await self.db.users.update_one({"_id": ObjectId(user_id)}, {"$set": {"blocked": True}})
-            return
-        if action == "unblock":
-            await self.db.users.update_one({"_id": ObjectId(user_id)}, {"$set": {"blocked": False}})
-            return
-        if action == "reset_profile":
-            object_id = ObjectId(user_id)
+            await self.db.users.update_one({"_id": object_id}, {"$set": {"role": "ADMIN"}})
+        elif action == "remove_admin":
+            await self.db.users.update_one({"_id": object_id}, {"$set": {"role": "USER"}})
+        elif action == "block":
+            await self.db.users.update_one({"_id": object_id}, {"$set": {"blocked": True}})
+        elif action == "unblock":
+            await self.db.users.update_one({"_id": object_id}, {"$set": {"blocked": False}})
+        elif action == "reset_profile":
             await self.db.capstone_profiles.delete_many({"user_id": object_id})
             await self.db.mentor_profiles.delete_many({"user_id": object_id})
             await self.db.mentor_email_templates.delete_many({"mentor_id": object_id})
+            mentor_template_overrides.discard_where(lambda key: key[0] == user_id)
             await self.db.users.update_one(
                 {"_id": object_id},
                 {"$set": {"role": "USER", "role_selected": False}},
             )
-            return
-        raise AppError(400, "invalid_action", "Invalid admin action")
+            await mentor_profile_changed(self.db, object_id)
+        else:
+            raise AppError(400, "invalid_action", "Invalid admin action")
+        await self.db.users.update_one({"_id": object_id}, {"$inc": {"auth_version": 1}})
+        user_cache.discard(user_id)
+        await profile_changed(self.db, object_id)
@@ -5,11 +5,14 @@ from typing import Any
 import anyio
 import jwt
 import logging
+from bson import ObjectId
 from google.auth.transport import requests
 from google.oauth2 import id_token
 
 from app.core.config import settings
-from app.core.jwt import TokenType, create_access_token, create_refresh_token, decode_token
+from app.core.jwt import TokenType, create_refresh_token, decode_token
+from app.services.onboarding_service import OnboardingService
+from app.services.profile_events import user_synced
 from app.services.user_service import UserService
 from app.utils.errors import AppError
 
@@ -18,6 +21,7 @@ class AuthService:
     def __init__(self, db):
         self.db = db
         self.user_service = UserService(db)
+        self.onboarding = OnboardingService(db)
 
     async def login_with_google(self, token: str) -> dict:
         payload = await self._verify_google_token(token)
@@ -41,8 +45,9 @@ class AuthService:
                 await self.user_service.update_role(user["id"], "ADMIN", role_selected=True)
                 user = await self.user_service.get_user_by_id(user["id"])
             await self.user_service.update_last_login(user["id"])
+        await user_synced(self.db, ObjectId(user["id"]))
 
-        access_token = create_access_token(user["id"])
+        access_token = await self.onboarding.reissue_access_token(user["id"])
         refresh_token = create_refresh_token(user["id"])
         return {"user": user, "access_token": access_token, "refresh_token": refresh_token}
 
@@ -62,9 +67,10 @@ class AuthService:
         if not user:
             raise AppError(401, "user_not_found", "User not found")
 
+        _state, access_token = await self.onboarding.issue_access_token(user)
         return {
             "user": user,
-            "access_token": create_access_token(user["id"]),
+            "access_token": access_token,
             "refresh_token": create_refresh_token(user["id"]),
         }
 
@@ -86,9 +92,10 @@ class AuthService:
                 await self.user_service.update_role(user["id"], "ADMIN", role_selected=True)
                 user = await self.user_service.get_user_by_id(user["id"])
             await self.user_service.update_last_login(user["id"])
+        await user_synced(self.db, ObjectId(user["id"]))
         return {
             "user": user,
-            "access_token": create_access_token(user["id"]),
+            "access_token": await self.onboarding.reissue_access_token(user["id"]),
             "refresh_token": create_refresh_token(user["id"]),
         }
 
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 from bson import ObjectId
 
+from app.services.profile_events import profile_changed
+from app.services.team_service import TeamService
+from app.services.user_service import UserService
 from app.utils.errors import AppError
 from app.utils.mongo import normalize_id
+from app.utils.skills import normalize_skills
 
 
 class CapstoneProfileService:
@@ -43,13 +47,15 @@ class CapstoneProfileService:
         availability = availability.strip()
         if not cleaned_skills or not cleaned_required or not cleaned_links or not bio or not availability:
             raise AppError(400, "profile_incomplete", "All profile fields are required.")
-        await self.db.capstone_profiles.update_one(
+        result = await self.db.capstone_profiles.update_one(
             {"user_id": ObjectId(user_id)},
             {
                 "$set": {
                     "user_id": ObjectId(user_id),
                     "skills": cleaned_skills,
+                    "skills_norm": normalize_skills(cleaned_skills),
                     "required_skills": cleaned_required,
+                    "required_skills_norm": normalize_skills(cleaned_required),
                     "links": cleaned_links,
                     "looking_for": looking_for,
                     "mentor_assigned": False,
@@ -59,4 +65,24 @@ class CapstoneProfileService:
             },
             upsert=True,
         )
+        if result.upserted_id is not None:
+            await TeamService(self.db).recount(ObjectId(user_id))
+        await UserService(self.db).bump_auth_version(user_id)
+        await profile_changed(self.db, ObjectId(user_id))
         return await self.get_my_profile(user_id)
+
+    async def backfill_normalized_skills(self) -> None:
+        cursor = self.db.capstone_profiles.find(
+            {"$or": [{"skills_norm": {"$exists": False}}, {"required_skills_norm": {"$exists": False}}]},
+            {"skills": 1, "required_skills": 1},
+        )
+        async for doc in cursor:
+            await self.db.capstone_profiles.update_one(
+                {"_id": doc["_id"]},
+                {
+                    "$set": {
+                        "skills_norm": normalize_skills(doc.get("skills")),
+                        "required_skills_norm": normalize_skills(doc.get("required_skills")),
+                    }
+                },
+            )
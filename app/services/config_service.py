@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from app.core.config import settings
+from app.utils.assets import asset_manifest
 
 
 class ConfigService:
     def get_public_config(self) -> dict:
-        return {"google_client_id": settings.google_client_id}
+        return {"google_client_id": settings.google_client_id, "assets": asset_manifest.urls()}
@@ -4,8 +4,23 @@ import re
 
 from bson import ObjectId
 
-from app.utils.mongo import normalize_id
-from app.utils.profile import is_capstone_profile_complete
+from app.core.config import settings
+from app.services.name_search_service import NameSearchService
+from app.services.recommendation_engine import recommendation_engine
+from app.services.skill_index import skill_index
+from app.services.team_service import team_status_for
+from app.utils.cache import AsyncLRUCache
+from app.utils.errors import AppError
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.skills import normalize_skills
+
+PROFILE_PROJECTION = {"user_id": 1, "name": 1, "skills": 1, "looking_for": 1, "team_count": 1}
+
+discovery_cache = AsyncLRUCache(
+    max_entries=settings.discovery_cache_max_entries,
+    max_bytes=settings.discovery_cache_max_bytes,
+    ttl_seconds=settings.discovery_cache_ttl_seconds,
+)
 
 
 class DiscoveryService:
@@ -22,13 +37,8 @@ class DiscoveryService:
         limit: int = 20,
         page: int = 1,
         pool: bool = False,
-    ) -> list[dict]:
-        base_query: dict = {}
-        if looking_for:
-            base_query["looking_for"] = looking_for
-        if mentor_assigned is not None:
-            base_query["mentor_assigned"] = mentor_assigned
-
+        cursor: str | None = None,
+    ) -> dict:
         skills_terms = skills or []
         name_query = None
         if search and search.strip():
@@ -36,131 +46,111 @@ class DiscoveryService:
             extra_terms = [part for part in re.split(r"[,\s]+", name_query) if part]
             skills_terms = list({*skills_terms, *extra_terms})
 
-        profiles_by_user: dict[str, dict] = {}
-        fetch_multiplier = max(3, page + 2)
-        fetch_limit = limit * fetch_multiplier
+        skills_terms = normalize_skills(skills_terms)
+        after = self._decode_cursor(cursor) if cursor else None
+        skip = 0 if pool or after else (page - 1) * limit
+
+        # Cached rows are shared by every caller, so they start at the page origin (offset 0 or the cursor)
+        # and run one row past the page; offsets are then counted over the list with the caller removed.
+        count = skip + limit + 1
+        key = (
+            tuple(sorted(skills_terms)),
+            name_query.lower() if name_query else None,
+            looking_for,
+            mentor_assigned,
+            count,
+            after,
+        )
+        docs = await discovery_cache.get_or_set(
+            key,
+            lambda: self._discover_page(skills_terms, name_query, looking_for, mentor_assigned, count, after),
+        )
+        docs = [doc for doc in docs if str(doc["user_id"]) != current_user_id][skip : skip + limit]
+
+        next_cursor = None
+        if len(docs) == limit:
+            last = docs[-1]
+            next_cursor = encode_cursor({"score": last.get("skill_score", 0), "user_id": str(last["user_id"])})
+        return {"items": [self._format_user(doc) for doc in docs], "next_cursor": next_cursor}
+
+    async def _discover_page(
+        self,
+        skills_terms: list[str],
+        name_query: str | None,
+        looking_for: str | None,
+        mentor_assigned: bool | None,
+        limit: int,
+        after: tuple[int, ObjectId] | None,
+    ) -> list[dict]:
+        base_query: dict = {"discoverable": True}
+        if looking_for:
+            base_query["looking_for"] = looking_for
+        if mentor_assigned is not None:
+            base_query["mentor_assigned"] = mentor_assigned
 
-        if not skills_terms and not name_query:
-            query = {**base_query, "user_id": {"$ne": ObjectId(current_user_id)}}
-            cursor = self.db.capstone_profiles.find(query).sort("user_id", 1).limit(fetch_limit)
-            async for doc in cursor:
-                profile = normalize_id(doc)
-                profiles_by_user[str(profile["user_id"])] = profile
-        else:
-            if name_query:
-                regex = re.compile(re.escape(name_query), re.IGNORECASE)
-                user_cursor = self.db.users.find({"name": regex}, {"_id": 1})
-                user_ids = [user["_id"] async for user in user_cursor]
-                if user_ids:
-                    query = {**base_query, "user_id": {"$in": user_ids, "$ne": ObjectId(current_user_id)}}
-                    cursor = self.db.capstone_profiles.find(query).limit(fetch_limit)
-                    async for doc in cursor:
-                        profile = normalize_id(doc)
-                        profiles_by_user[str(profile["user_id"])] = profile
-            if skills_terms:
-                patterns = [re.compile(f"^{re.escape(skill)}$", re.IGNORECASE) for skill in skills_terms]
-                query = {**base_query, "skills": {"$in": patterns}, "user_id": {"$ne": ObjectId(current_user_id)}}
-                cursor = self.db.capstone_profiles.find(query).limit(fetch_limit)
-                async for doc in cursor:
-                    profile = normalize_id(doc)
-                    profiles_by_user[str(profile["user_id"])] = profile
-
-        profiles = list(profiles_by_user.values())
-        ranked = self._rank_by_skill_match(profiles, skills_terms)
-        results = []
-        for profile in ranked:
-            user = await self.db.users.find_one({"_id": profile["user_id"]})
-            if not user:
-                continue
-            if user.get("role") in {"ADMIN", "MENTOR"}:
-                continue
-            if user.get("blocked"):
-                continue
-            if not is_capstone_profile_complete(profile):
-                continue
-            team_count, team_status = await self._get_team_status(profile["user_id"])
-            results.append(
-                {
-                    "id": str(profile["user_id"]),
-                    "name": user["name"],
-                    "skills": profile.get("skills", []),
-                    "looking_for": profile.get("looking_for"),
-                    "team_status": team_status,
-                    "team_count": team_count,
-                }
+        if skills_terms or name_query:
+            name_user_ids = await NameSearchService(self.db).find_user_ids(name_query) if name_query else []
+            await skill_index.ensure_loaded(self.db)
+            counts = skill_index.rank(
+                skills_terms,
+                looking_for=looking_for,
+                mentor_assigned=mentor_assigned,
+                extra_ids=name_user_ids,
             )
-        if pool:
-            return results[:limit]
-        start = (page - 1) * limit
-        return results[start:start + limit]
+            picks = skill_index.top_k(counts, limit, after=after)
+            return await self._fetch_ranked(base_query, picks)
+
+        if after:
+            # Unranked pages are ordered by user_id alone, so the keyset bound can use the index.
+            base_query["user_id"] = {"$gt": after[1]}
+        profiles = self.db.capstone_profiles.find(base_query, PROFILE_PROJECTION).sort("user_id", 1).limit(limit)
+        return [doc async for doc in profiles]
 
     async def recommended_users(self, current_user_id: str, limit: int = 10) -> list[dict]:
-        profile = await self.db.capstone_profiles.find_one({"user_id": ObjectId(current_user_id)})
-        required = profile.get("required_skills", []) if profile else []
-        if required:
-            patterns = [re.compile(f"^{re.escape(skill)}$", re.IGNORECASE) for skill in required]
-            cursor = self.db.capstone_profiles.find({"skills": {"$in": patterns}}).limit(limit * 3)
-            candidates = []
-            async for doc in cursor:
-                profile_doc = normalize_id(doc)
-                if str(profile_doc["user_id"]) == current_user_id:
-                    continue
-                candidates.append(profile_doc)
-            ranked = self._rank_by_skill_match(candidates, required)
-            picks = ranked[:limit]
+        base_query = {"discoverable": True, "user_id": {"$ne": ObjectId(current_user_id)}}
+        await recommendation_engine.ensure_loaded(self.db)
+        picks = recommendation_engine.recommend(ObjectId(current_user_id), limit)
+        if picks is not None:
+            docs = await self._fetch_ranked(base_query, picks)
         else:
-            pipeline = [{"$match": {"user_id": {"$ne": ObjectId(current_user_id)}}}, {"$sample": {"size": limit}}]
-            cursor = self.db.capstone_profiles.aggregate(pipeline)
-            picks = [normalize_id(doc) async for doc in cursor]
-
-        results = []
-        for profile in picks:
-            user = await self.db.users.find_one({"_id": profile["user_id"]})
-            if not user:
-                continue
-            if user.get("role") in {"ADMIN", "MENTOR"}:
-                continue
-            if user.get("blocked"):
-                continue
-            if not is_capstone_profile_complete(profile):
-                continue
-            team_count, team_status = await self._get_team_status(profile["user_id"])
-            results.append(
-                {
-                    "id": str(profile["user_id"]),
-                    "name": user["name"],
-                    "skills": profile.get("skills", []),
-                    "looking_for": profile.get("looking_for"),
-                    "team_status": team_status,
-                    "team_count": team_count,
-                }
-            )
-        return results
-
-    def _rank_by_skill_match(self, profiles: list[dict], skills: list[str]) -> list[dict]:
-        if not skills:
-            return sorted(profiles, key=lambda p: str(p.get("user_id")))
-
-        norm_skills = {skill.strip().lower() for skill in skills if skill.strip()}
-
-        def score(profile: dict) -> int:
-            profile_skills = {s.lower() for s in profile.get("skills", [])}
-            return len(profile_skills & norm_skills)
-
-        return sorted(profiles, key=lambda p: (-score(p), str(p.get("user_id"))))
-
-    async def _get_team_status(self, user_id: ObjectId) -> tuple[int, str]:
-        query = {
-            "status": "ACCEPTED",
-            "type": "CAPSTONE",
-            "$or": [
-                {"from_user_id": user_id},
-                {"to_user_id": user_id},
-            ],
+            pipeline = [
+                {"$match": base_query},
+                {"$sample": {"size": limit}},
+                {"$project": PROFILE_PROJECTION},
+            ]
+            docs = [doc async for doc in self.db.capstone_profiles.aggregate(pipeline)]
+        return [self._format_user(doc) for doc in docs]
+
+    async def _fetch_ranked(self, base_query: dict, picks: list[tuple]) -> list[dict]:
+        # The index decides order; the database re-checks eligibility for the picked page only.
+        if not picks:
+            return []
+        query = {**base_query, "user_id": {**base_query.get("user_id", {}), "$in": [user_id for _, user_id in picks]}}
+        cursor = self.db.capstone_profiles.find(query, PROFILE_PROJECTION)
+        docs = {doc["user_id"]: doc async for doc in cursor}
+        ranked = []
+        for score, user_id in picks:
+            doc = docs.get(user_id)
+            if doc:
+                doc["skill_score"] = score
+                ranked.append(doc)
+        return ranked
+
+    def _format_user(self, doc: dict) -> dict:
+        team_count = doc.get("team_count", 0)
+        return {
+            "id": str(doc["user_id"]),
+            "name": doc["name"],
+            "skills": doc.get("skills", []),
+            "looking_for": doc.get("looking_for"),
+            "team_status": team_status_for(team_count),
+            "team_count": team_count,
         }
-        count = await self.db.requests.count_documents(query)
-        if count == 0:
-            return count, "AVAILABLE"
-        if count >= 5:
-            return count, "BOOKED"
-        return count, "IN_TEAM"
+
+    def _decode_cursor(self, cursor: str) -> tuple[int, ObjectId]:
+        state = decode_cursor(cursor)
+        score = state.get("score")
+        user_id = state.get("user_id")
+        if not isinstance(score, int) or not isinstance(user_id, str) or not ObjectId.is_valid(user_id):
+            raise AppError(400, "invalid_cursor", "Invalid pagination cursor")
+        return score, ObjectId(user_id)
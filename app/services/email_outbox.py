@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+# Set on every enqueue so an idle worker in this process picks the job up without waiting for its next poll.
+outbox_wakeup = asyncio.Event()
+
+
+class EmailOutbox:
+    def __init__(self, db):
+        self.db = db
+
+    async def enqueue(self, to_email: str, subject: str, html_body: str) -> None:
+        now = datetime.now(timezone.utc)
+        await self.db.email_outbox.insert_one(
+            {
+                "to_email": to_email,
+                "subject": subject,
+                "html_body": html_body,
+                "status": "PENDING",
+                "attempts": 0,
+                "next_attempt_at": now,
+                "last_error": None,
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+        outbox_wakeup.set()
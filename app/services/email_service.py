@@ -2,19 +2,25 @@ from __future__ import annotations
 
 import asyncio
 import html
-import smtplib
 from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
+from typing import Awaitable, Callable
 
 from app.core.config import settings
+from app.services.email_outbox import EmailOutbox
+from app.services.smtp_async import async_smtp_pool
+from app.services.smtp_pool import smtp_pool
+from app.utils.templates import template_cache
 
 
 class EmailService:
-    def __init__(self) -> None:
+    # With a db the service queues mail on the outbox for the background worker; without one it sends inline.
+    def __init__(self, db=None) -> None:
         self._template_dir = Path(__file__).resolve().parents[1] / "templates"
+        self.outbox = EmailOutbox(db) if db is not None else None
 
     def _enabled(self) -> bool:
         return bool(settings.smtp_enabled and settings.smtp_user and settings.smtp_password)
@@ -26,11 +32,7 @@ class EmailService:
         return settings.smtp_from or settings.smtp_user
 
     def _render_template(self, name: str, context: dict[str, str]) -> str:
-        path = self._template_dir / name
-        template = path.read_text(encoding="utf-8")
-        for key, value in context.items():
-            template = template.replace(f"{{{{{key}}}}}", value)
-        return template
+        return template_cache.from_file(self._template_dir / name).render(context)
 
     async def send_request_created(
         self,
@@ -124,6 +126,34 @@ class EmailService:
         subject = f"{mentor_name} accepted your mentorship request"
         await self._send_email(recipient_email, subject, html_body)
 
+    def render_digest(self, *, recipient_name: str, entries: list[tuple[str, str, str, str]], cta_url: str) -> str:
+        # entries are (sender_name, kind label, message, cta_url) for each buffered notification, oldest first.
+        blocks = []
+        for sender_name, label, message, entry_url in entries:
+            safe_message = html.escape(message or "").replace("\n", "<br>")
+            link = (
+                f'<p style="margin:8px 0 0 0;font-size:12px;"><a href="{html.escape(entry_url)}" '
+                'style="color:#1F2A36;">Open</a></p>'
+                if entry_url
+                else ""
+            )
+            blocks.append(
+                '<div style="margin-top:16px;padding:12px 16px;border-left:3px solid #C7A35A;background-color:#FAF8F4;">'
+                f'<p style="margin:0;font-size:14px;font-weight:600;">'
+                f"{html.escape(sender_name or 'A NYA member')} &middot; {html.escape(label)}</p>"
+                f'<p style="margin:6px 0 0 0;font-size:14px;line-height:1.6;color:#4B5563;">{safe_message}</p>'
+                f"{link}</div>"
+            )
+        return self._render_template(
+            "email_request_digest.html",
+            {
+                "recipient_name": html.escape(recipient_name or "there"),
+                "headline": "1 new request" if len(entries) == 1 else f"{len(entries)} new requests",
+                "items": "".join(blocks),
+                "cta_url": html.escape(cta_url),
+            },
+        )
+
     async def send_custom_html(self, recipient_email: str, subject: str, html_body: str) -> None:
         if not self._enabled():
             return
@@ -140,15 +170,10 @@ class EmailService:
     ) -> None:
         if not self._enabled():
             return
-        await asyncio.to_thread(
-            self._send_email_with_attachment_sync,
-            recipient_email,
-            subject,
-            html_body,
-            attachment_name,
-            attachment_content,
-            mime_type,
+        msg = self._build_attachment_message(
+            recipient_email, subject, html_body, attachment_name, attachment_content, mime_type
         )
+        await self._transmit(recipient_email, msg)
 
     async def send_mentor_application_created(
         self,
@@ -204,28 +229,57 @@ class EmailService:
         subject = "You're approved as a NYA prefect"
         await self._send_email(recipient_email, subject, html_body)
 
+    async def deliver(self, to_email: str, subject: str, html_body: str) -> None:
+        await self._transmit(to_email, self._build_message(to_email, subject, html_body))
+
+    async def deliver_many(
+        self,
+        messages: list[tuple[str, str, str]],
+        on_result: Callable[[int, Exception | None], Awaitable[None]] | None = None,
+    ) -> list[Exception | None]:
+        # (to_email, subject, html_body) triples sent over shared pooled sessions; returns per-message errors.
+        # on_result(index, error) is awaited as each message finishes, in order.
+        built = [
+            (self._from_address(), [to_email], self._build_message(to_email, subject, html_body).as_string())
+            for to_email, subject, html_body in messages
+        ]
+        if self._use_async_transport():
+            return await async_smtp_pool.send_many(built, on_result)
+        loop = asyncio.get_running_loop()
+
+        def report(index: int, error: Exception | None) -> None:
+            # Runs on the sender thread; waits for the callback so results stay in order.
+            asyncio.run_coroutine_threadsafe(on_result(index, error), loop).result()
+
+        return await asyncio.to_thread(smtp_pool.send_many, built, report if on_result else None)
+
     async def _send_email(self, to_email: str, subject: str, html_body: str) -> None:
-        await asyncio.to_thread(self._send_email_sync, to_email, subject, html_body)
+        if self.outbox is not None:
+            await self.outbox.enqueue(to_email, subject, html_body)
+            return
+        await self.deliver(to_email, subject, html_body)
+
+    async def _transmit(self, to_email: str, msg: MIMEMultipart) -> None:
+        if self._use_async_transport():
+            await async_smtp_pool.send(msg["From"], [to_email], msg.as_string())
+        else:
+            await asyncio.to_thread(smtp_pool.send, msg["From"], [to_email], msg.as_string())
+
+    def _use_async_transport(self) -> bool:
+        # "auto" prefers the event-loop client and falls back to the thread pool when aiosmtplib is missing.
+        if settings.smtp_transport == "thread":
+            return False
+        return async_smtp_pool.available()
 
-    def _send_email_sync(self, to_email: str, subject: str, html_body: str) -> None:
+    def _build_message(self, to_email: str, subject: str, html_body: str) -> MIMEMultipart:
         msg = MIMEMultipart("alternative")
         msg["Subject"] = subject
         msg["From"] = self._from_address()
         msg["To"] = to_email
         msg.attach(MIMEText(html_body, "html", "utf-8"))
+        return msg
 
-        if settings.smtp_use_starttls:
-            with smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=10) as server:
-                server.ehlo()
-                server.starttls()
-                server.login(settings.smtp_user, settings.smtp_password)
-                server.sendmail(msg["From"], [to_email], msg.as_string())
-        else:
-            with smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port, timeout=10) as server:
-                server.login(settings.smtp_user, settings.smtp_password)
-                server.sendmail(msg["From"], [to_email], msg.as_string())
-
-    def _send_email_with_attachment_sync(
+    def _build_attachment_message(
         self,
         to_email: str,
         subject: str,
@@ -233,7 +287,7 @@ class EmailService:
         attachment_name: str,
         attachment_content: bytes,
         mime_type: str = "text/plain",
-    ) -> None:
+    ) -> MIMEMultipart:
         msg = MIMEMultipart("mixed")
         msg["Subject"] = subject
         msg["From"] = self._from_address()
@@ -249,14 +303,4 @@ class EmailService:
         encoders.encode_base64(attachment)
         attachment.add_header("Content-Disposition", f'attachment; filename="{attachment_name}"')
         msg.attach(attachment)
-
-        if settings.smtp_use_starttls:
-            with smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=10) as server:
-                server.ehlo()
-                server.starttls()
-                server.login(settings.smtp_user, settings.smtp_password)
-                server.sendmail(msg["From"], [to_email], msg.as_string())
-        else:
-            with smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port, timeout=10) as server:
-                server.login(settings.smtp_user, settings.smtp_password)
-                server.sendmail(msg["From"], [to_email], msg.as_string())
+        return msg
@@ -4,6 +4,7 @@ import html
 from pathlib import Path
 
 from app.utils.errors import AppError
+from app.utils.templates import CompiledTemplate, template_cache
 
 
 class EmailTemplateService:
@@ -57,10 +58,14 @@ class EmailTemplateService:
     def update_template(self, template_id: str, content: str) -> None:
         meta = self._get_meta(template_id)
         self._write_template(meta["file"], content)
+        template_cache.invalidate(self._template_dir / meta["file"])
 
     def render_preview(self, template_id: str, content: str | None = None) -> str:
         meta = self._get_meta(template_id)
-        template = content if content is not None else self._read_template(meta["file"])
+        if content is not None:
+            template = CompiledTemplate(content)
+        else:
+            template = template_cache.from_file(self._template_dir / meta["file"])
         return self._apply_context(template, meta["sample"])
 
     def _get_meta(self, template_id: str) -> dict:
@@ -76,11 +81,10 @@ class EmailTemplateService:
         path = self._template_dir / filename
         path.write_text(content, encoding="utf-8")
 
-    def _apply_context(self, template: str, context: dict[str, str]) -> str:
-        rendered = template
+    def _apply_context(self, template: CompiledTemplate, context: dict[str, str]) -> str:
+        escaped = {}
         for key, value in context.items():
-            escaped = html.escape(value)
+            escaped[key] = html.escape(value)
             if key == "message":
-                escaped = escaped.replace("\n", "<br>")
-            rendered = rendered.replace(f"{{{{{key}}}}}", escaped)
-        return rendered
+                escaped[key] = escaped[key].replace("\n", "<br>")
+        return template.render(escaped)
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+
+from pymongo import ReturnDocument
+
+from app.core.config import settings
+from app.services.email_outbox import outbox_wakeup
+from app.services.email_service import EmailService
+from app.services.notification_digest_service import NotificationDigestService
+
+logger = logging.getLogger("nya.email")
+
+
+class EmailOutboxWorker:
+    # Claims outbox jobs with a lease so a crashed worker's jobs are picked up again once the lease runs out.
+    def __init__(self) -> None:
+        self._task: asyncio.Task | None = None
+        self._digest_task: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+        self._email_service = EmailService()
+
+    def start(self, db) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(db))
+        if self._digest_task is None or self._digest_task.done():
+            self._digest_task = asyncio.create_task(self._flush_digests(db))
+
+    async def stop(self) -> None:
+        for task in (self._task, self._digest_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._digest_task = None
+        if self._inflight:
+            await asyncio.wait(self._inflight, timeout=10)
+
+    async def _run(self, db) -> None:
+        slots = asyncio.Semaphore(max(settings.email_outbox_concurrency, 1))
+        while True:
+            await slots.acquire()
+            jobs = await self._claim_batch(db)
+            if not jobs:
+                slots.release()
+                outbox_wakeup.clear()
+                try:
+                    await asyncio.wait_for(outbox_wakeup.wait(), timeout=settings.email_outbox_poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            task = asyncio.create_task(self._deliver(db, jobs))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+            task.add_done_callback(lambda _task: slots.release())
+
+    async def _flush_digests(self, db) -> None:
+        digests = NotificationDigestService(db)
+        while True:
+            try:
+                await digests.flush_due()
+            except Exception as exc:
+                logger.warning("Notification digest flush failed: %s", exc)
+            await asyncio.sleep(settings.notification_digest_poll_seconds)
+
+    async def _claim_batch(self, db) -> list[dict]:
+        # Jobs claimed together are sent over one pooled SMTP session.
+        jobs: list[dict] = []
+        while len(jobs) < max(settings.email_outbox_batch_size, 1):
+            try:
+                job = await self._claim(db)
+            except Exception as exc:
+                logger.warning("Email outbox claim failed: %s", exc)
+                break
+            if job is None:
+                break
+            jobs.append(job)
+        return jobs
+
+    async def _claim(self, db) -> dict | None:
+        now = datetime.now(timezone.utc)
+        return await db.email_outbox.find_one_and_update(
+            {"status": {"$in": ["PENDING", "SENDING"]}, "next_attempt_at": {"$lte": now}},
+            {
+                "$set": {
+                    "status": "SENDING",
+                    "next_attempt_at": now + timedelta(seconds=settings.email_outbox_lease_seconds),
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("next_attempt_at", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def _deliver(self, db, jobs: list[dict]) -> None:
+        recorded: set[int] = set()
+
+        async def record(index: int, error: Exception | None) -> None:
+            # Each job is settled as soon as its own send finishes, and the rest of the batch gets a
+            # fresh lease, so a slow batch is never re-claimed and sent twice.
+            recorded.add(index)
+            try:
+                if error is None:
+                    await self._mark_sent(db, jobs[index])
+                else:
+                    await self._fail(db, jobs[index], error)
+                remaining = [job["_id"] for job in jobs[index + 1 :]]
+                if remaining:
+                    lease_until = datetime.now(timezone.utc) + timedelta(seconds=settings.email_outbox_lease_seconds)
+                    await db.email_outbox.update_many(
+                        {"_id": {"$in": remaining}, "status": "SENDING"},
+                        {"$set": {"next_attempt_at": lease_until}},
+                    )
+            except Exception as exc:
+                logger.warning("Email outbox bookkeeping failed for %s: %s", jobs[index]["_id"], exc)
+
+        try:
+            await self._email_service.deliver_many(
+                [(job["to_email"], job["subject"], job["html_body"]) for job in jobs],
+                on_result=record,
+            )
+        except Exception as exc:
+            for index, job in enumerate(jobs):
+                if index not in recorded:
+                    await self._fail(db, job, exc)
+
+    async def _mark_sent(self, db, job: dict) -> None:
+        now = datetime.now(timezone.utc)
+        await db.email_outbox.update_one(
+            {"_id": job["_id"]},
+            {"$set": {"status": "SENT", "sent_at": now, "updated_at": now, "last_error": None}},
+        )
+
+    async def _fail(self, db, job: dict, exc: Exception) -> None:
+        now = datetime.now(timezone.utc)
+        attempts = job.get("attempts", 1)
+        update = {"last_error": str(exc)[:500], "updated_at": now}
+        if attempts >= settings.email_outbox_max_attempts:
+            update["status"] = "DEAD"
+            logger.warning("Email to %s dead-lettered after %s attempts: %s", job["to_email"], attempts, exc)
+        else:
+            delay = settings.email_outbox_backoff_seconds * 2 ** (attempts - 1)
+            update["status"] = "PENDING"
+            update["next_attempt_at"] = now + timedelta(seconds=delay * random.uniform(0.8, 1.2))
+        await db.email_outbox.update_one({"_id": job["_id"]}, {"$set": update})
+
+
+email_outbox_worker = EmailOutboxWorker()
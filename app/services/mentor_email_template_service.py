@@ -6,7 +6,15 @@ from pathlib import Path
 
 from bson import ObjectId
 
+from app.core.config import settings
+from app.utils.cache import EpochTTLCache
 from app.utils.errors import AppError
+from app.utils.templates import CompiledTemplate, template_cache
+
+
+# (mentor_id, template_id) -> override doc, or None when the mentor uses the default file.
+# The TTL bounds how long another worker's edit can go unseen.
+mentor_template_overrides = EpochTTLCache(ttl_seconds=settings.mentor_template_cache_ttl_seconds)
 
 
 class MentorEmailTemplateService:
@@ -60,15 +68,20 @@ class MentorEmailTemplateService:
     async def update_template(self, mentor_id: str, template_id: str, content: str) -> None:
         meta = self._get_meta(template_id)
         await self._write_template(mentor_id, template_id, meta["file"], content)
+        mentor_template_overrides.discard((mentor_id, template_id))
+        template_cache.invalidate(("mentor", mentor_id, template_id))
 
     async def render_preview(self, mentor_id: str, template_id: str, content: str | None = None) -> str:
         meta = self._get_meta(template_id)
-        template = content if content is not None else await self._get_content(mentor_id, template_id, meta["file"])
+        if content is not None:
+            template = CompiledTemplate(content)
+        else:
+            template = await self._get_compiled(mentor_id, template_id, meta["file"])
         return self._apply_context(template, meta["sample"])
 
     async def render_with_context(self, mentor_id: str, template_id: str, context: dict[str, str]) -> str:
         meta = self._get_meta(template_id)
-        template = await self._get_content(mentor_id, template_id, meta["file"])
+        template = await self._get_compiled(mentor_id, template_id, meta["file"])
         return self._apply_context(template, context)
 
     def _get_meta(self, template_id: str) -> dict:
@@ -76,6 +89,39 @@ class MentorEmailTemplateService:
             raise AppError(404, "template_not_found", "Template not found")
         return self._templates[template_id]
 
+    async def preload_overrides(self) -> None:
+        epoch = mentor_template_overrides.epoch
+        mentor_ids = [
+            doc["user_id"]
+            async for doc in self.db.mentor_profiles.find({"approved_by_admin": True}, {"user_id": 1})
+        ]
+        if not mentor_ids:
+            return
+        found: dict[tuple[str, str], dict] = {}
+        cursor = self.db.mentor_email_templates.find(
+            {"mentor_id": {"$in": mentor_ids}, "template_id": {"$in": list(self._templates)}},
+            {"mentor_id": 1, "template_id": 1, "content": 1, "updated_at": 1},
+        )
+        async for doc in cursor:
+            found[(str(doc["mentor_id"]), doc["template_id"])] = doc
+        for mentor_id in mentor_ids:
+            for template_id in self._templates:
+                doc = found.get((str(mentor_id), template_id))
+                mentor_template_overrides.put((str(mentor_id), template_id), doc, epoch)
+
+    async def _get_compiled(self, mentor_id: str, template_id: str, filename: str) -> CompiledTemplate:
+        cached, doc = mentor_template_overrides.get((mentor_id, template_id))
+        if not cached:
+            epoch = mentor_template_overrides.epoch
+            doc = await self.db.mentor_email_templates.find_one(
+                {"mentor_id": ObjectId(mentor_id), "template_id": template_id},
+                {"content": 1, "updated_at": 1},
+            )
+            mentor_template_overrides.put((mentor_id, template_id), doc, epoch)
+        if doc and doc.get("content"):
+            return template_cache.from_source(("mentor", mentor_id, template_id), doc.get("updated_at"), doc["content"])
+        return template_cache.from_file(self._template_dir / filename)
+
     async def _get_content(self, mentor_id: str, template_id: str, filename: str) -> str:
         doc = await self.db.mentor_email_templates.find_one(
             {"mentor_id": ObjectId(mentor_id), "template_id": template_id}
@@ -96,11 +142,10 @@ class MentorEmailTemplateService:
         path = self._template_dir / filename
         return path.read_text(encoding="utf-8")
 
-    def _apply_context(self, template: str, context: dict[str, str]) -> str:
-        rendered = template
+    def _apply_context(self, template: CompiledTemplate, context: dict[str, str]) -> str:
+        escaped = {}
         for key, value in context.items():
-            escaped = html.escape(value)
+            escaped[key] = html.escape(value)
             if key == "message":
-                escaped = escaped.replace("\n", "<br>")
-            rendered = rendered.replace(f"{{{{{key}}}}}", escaped)
-        return rendered
+                escaped[key] = escaped[key].replace("\n", "<br>")
+        return template.render(escaped)
@@ -4,6 +4,8 @@ from bson import ObjectId
 
 from app.core.config import settings
 from app.services.email_service import EmailService
+from app.services.profile_events import mentor_profile_changed
+from app.services.user_service import UserService
 from app.utils.errors import AppError
 from app.utils.mongo import normalize_id
 
@@ -11,7 +13,7 @@ from app.utils.mongo import normalize_id
 class MentorProfileService:
     def __init__(self, db):
         self.db = db
-        self.email_service = EmailService()
+        self.email_service = EmailService(db)
 
     async def get_my_profile(self, user_id: str) -> dict:
         doc = await self.db.mentor_profiles.find_one({"user_id": ObjectId(user_id)})
@@ -57,6 +59,8 @@ class MentorProfileService:
             },
             upsert=True,
         )
+        await UserService(self.db).bump_auth_version(user_id)
+        await mentor_profile_changed(self.db, ObjectId(user_id))
         profile = await self.get_my_profile(user_id)
         await self._notify_admin_mentor_application(user_id, profile)
         return profile
@@ -92,6 +96,7 @@ class MentorProfileService:
             {"_id": ObjectId(mentor_profile_id)},
             {"$set": {"approved_by_admin": True}},
         )
+        await self._bump_mentor_auth_version(mentor_profile_id)
         await self._notify_mentor_application_approved(mentor_profile_id)
 
     async def reject(self, mentor_profile_id: str) -> None:
@@ -101,6 +106,12 @@ class MentorProfileService:
             {"_id": ObjectId(mentor_profile_id)},
             {"$set": {"approved_by_admin": False}},
         )
+        await self._bump_mentor_auth_version(mentor_profile_id)
+
+    async def _bump_mentor_auth_version(self, mentor_profile_id: str) -> None:
+        doc = await self.db.mentor_profiles.find_one({"_id": ObjectId(mentor_profile_id)}, {"user_id": 1})
+        if doc:
+            await UserService(self.db).bump_auth_version(str(doc["user_id"]))
 
     async def _notify_admin_mentor_application(self, user_id: str, profile: dict) -> None:
         user = await self.db.users.find_one({"_id": ObjectId(user_id)})
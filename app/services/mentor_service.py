@@ -4,6 +4,7 @@ import re
 
 from bson import ObjectId
 
+from app.services.name_search_service import NameSearchService
 from app.utils.errors import AppError
 from app.utils.mongo import normalize_id
 
@@ -16,7 +17,7 @@ class MentorService:
         query: dict = {"approved_by_admin": True}
         if search:
             regex = re.compile(re.escape(search), re.IGNORECASE)
-            user_ids = [user["_id"] async for user in self.db.users.find({"name": regex}, {"_id": 1})]
+            user_ids = await NameSearchService(self.db).find_user_ids(search, {"role": "MENTOR"})
             or_filters = [{"domain": regex}, {"expertise": regex}]
             if user_ids:
                 or_filters.append({"user_id": {"$in": user_ids}})
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from bson import ObjectId
+
+from app.utils.search import name_prefixes, query_prefixes
+
+
+class NameSearchService:
+    def __init__(self, db):
+        self.db = db
+
+    async def find_user_ids(self, query: str, extra: dict | None = None) -> list[ObjectId]:
+        prefixes = query_prefixes(query)
+        if not prefixes:
+            return []
+        cursor = self.db.users.find({"name_prefixes": {"$all": prefixes}, **(extra or {})}, {"_id": 1})
+        return [doc["_id"] async for doc in cursor]
+
+    async def backfill_missing(self) -> None:
+        cursor = self.db.users.find({"name_prefixes": {"$exists": False}}, {"name": 1})
+        async for doc in cursor:
+            await self.db.users.update_one(
+                {"_id": doc["_id"]},
+                {"$set": {"name_prefixes": name_prefixes(doc.get("name"))}},
+            )
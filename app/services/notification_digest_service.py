@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+
+from app.core.config import settings
+from app.services.email_service import EmailService
+
+DIGEST_KINDS = {
+    "request_created": "team request",
+    "mentor_request_created": "mentorship request",
+}
+
+
+class NotificationDigestService:
+    # Buffers request notifications for users in DIGEST mode and coalesces them into one email per window.
+    def __init__(self, db):
+        self.db = db
+        self.email_service = EmailService(db)
+
+    async def add(self, recipient: dict, kind: str, sender_name: str, message: str, cta_url: str) -> None:
+        await self.db.notification_digest_items.insert_one(
+            {
+                "recipient_id": ObjectId(str(recipient.get("id") or recipient.get("_id"))),
+                "to_email": recipient["email"],
+                "recipient_name": recipient.get("name", ""),
+                "kind": kind,
+                "sender_name": sender_name,
+                "message": message,
+                "cta_url": cta_url,
+                "flush_id": None,
+                "claimed_at": None,
+                "created_at": datetime.now(timezone.utc),
+            }
+        )
+
+    async def flush_due(self) -> int:
+        now = datetime.now(timezone.utc)
+        window_start = now - timedelta(seconds=settings.notification_digest_window_seconds)
+        stale_claim = now - timedelta(seconds=settings.email_outbox_lease_seconds)
+        # A recipient is due once their oldest buffered item has waited a full window.
+        pipeline = [
+            {"$match": {"$or": [{"flush_id": None}, {"claimed_at": {"$lt": stale_claim}}]}},
+            {"$group": {"_id": "$recipient_id", "oldest": {"$min": "$created_at"}}},
+            {"$match": {"oldest": {"$lte": window_start}}},
+        ]
+        recipient_ids = [row["_id"] async for row in self.db.notification_digest_items.aggregate(pipeline)]
+        sent = 0
+        for recipient_id in recipient_ids:
+            if await self._flush_recipient(recipient_id, now, stale_claim):
+                sent += 1
+        return sent
+
+    async def _flush_recipient(self, recipient_id: ObjectId, now: datetime, stale_claim: datetime) -> bool:
+        flush_id = ObjectId()
+        await self.db.notification_digest_items.update_many(
+            {"recipient_id": recipient_id, "$or": [{"flush_id": None}, {"claimed_at": {"$lt": stale_claim}}]},
+            {"$set": {"flush_id": flush_id, "claimed_at": now}},
+        )
+        items = [
+            doc
+            async for doc in self.db.notification_digest_items.find({"flush_id": flush_id}).sort("created_at", 1)
+        ]
+        if not items:
+            return False
+        latest = items[-1]
+        if len(items) == 1:
+            subject = f"{latest['sender_name'] or 'Someone'} sent you a {DIGEST_KINDS.get(latest['kind'], 'request')}"
+        else:
+            subject = f"You have {len(items)} new requests on NYA"
+        # Each row links to its own page; the footer button only narrows past the inbox when every row agrees.
+        row_urls = {item.get("cta_url", "") for item in items}
+        base_url = settings.frontend_origin or "http://localhost:8000"
+        html_body = self.email_service.render_digest(
+            recipient_name=latest.get("recipient_name", ""),
+            entries=[
+                (
+                    item.get("sender_name", ""),
+                    DIGEST_KINDS.get(item.get("kind"), "request"),
+                    item.get("message", ""),
+                    item.get("cta_url", ""),
+                )
+                for item in items
+            ],
+            cta_url=row_urls.pop() if len(row_urls) == 1 else f"{base_url}/requests",
+        )
+        await self.email_service.send_custom_html(latest["to_email"], subject, html_body)
+        await self.db.notification_digest_items.delete_many({"flush_id": flush_id})
+        return True
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from bson import ObjectId
+
+from app.core.jwt import create_access_token
+from app.services.user_service import UserService
+from app.utils.profile import is_capstone_profile_complete
+
+# Access-token claim carrying the onboarding state; "av" must match users.auth_version for it to be trusted.
+ONBOARDING_CLAIM = "onb"
+
+
+class OnboardingService:
+    def __init__(self, db):
+        self.db = db
+        self.user_service = UserService(db)
+
+    async def load_state(self, user: dict) -> dict:
+        role = user.get("role", "USER")
+        profile_complete = False
+        mentor_approved = False
+        if role == "MENTOR":
+            doc = await self.db.mentor_profiles.find_one({"user_id": ObjectId(user["id"])}, {"approved_by_admin": 1})
+            profile_complete = doc is not None
+            mentor_approved = bool(doc.get("approved_by_admin", False)) if doc else False
+        else:
+            doc = await self.db.capstone_profiles.find_one({"user_id": ObjectId(user["id"])})
+            profile_complete = is_capstone_profile_complete(doc)
+        return {
+            "role": role,
+            "role_selected": bool(user.get("role_selected", False)),
+            "profile_complete": profile_complete,
+            "mentor_approved": mentor_approved,
+            "av": user.get("auth_version", 0),
+        }
+
+    async def issue_access_token(self, user: dict) -> tuple[dict, str]:
+        state = await self.load_state(user)
+        return state, create_access_token(user["id"], {ONBOARDING_CLAIM: state})
+
+    async def reissue_access_token(self, user_id: str) -> str:
+        user = await self.user_service.get_user_by_id(user_id)
+        _state, token = await self.issue_access_token(user)
+        return token
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from bson import ObjectId
+
+from app.services.discovery_service import discovery_cache
+from app.services.recommendation_engine import recommendation_engine
+from app.services.skill_index import skill_index
+from app.services.skill_suggester import skill_suggester
+from app.utils.profile import is_discoverable
+
+
+async def profile_changed(db, user_id: ObjectId) -> None:
+    # Single fan-out point for anything derived from a user's capstone profile.
+    profile = await db.capstone_profiles.find_one({"user_id": user_id})
+    if profile:
+        user = await db.users.find_one({"_id": user_id}, {"name": 1, "role": 1, "blocked": 1})
+        await sync_denormalized(db, profile, user)
+    _fan_out(user_id, profile)
+
+
+async def user_synced(db, user_id: ObjectId) -> None:
+    # Logins only touch the user fields copied onto the profile; derived state is refreshed only if the copy moved.
+    profile = await db.capstone_profiles.find_one({"user_id": user_id})
+    if not profile:
+        return
+    user = await db.users.find_one({"_id": user_id}, {"name": 1, "role": 1, "blocked": 1})
+    if await sync_denormalized(db, profile, user):
+        _fan_out(user_id, profile)
+
+
+def _fan_out(user_id: ObjectId, profile: dict | None) -> None:
+    skill_index.apply(user_id, profile)
+    recommendation_engine.apply(user_id, profile)
+    skill_suggester.apply_capstone(user_id, profile)
+    discovery_cache.invalidate()
+
+
+async def mentor_profile_changed(db, user_id: ObjectId) -> None:
+    profile = await db.mentor_profiles.find_one({"user_id": user_id}, {"expertise": 1})
+    skill_suggester.apply_mentor(user_id, profile)
+
+
+async def sync_denormalized(db, profile: dict, user: dict | None) -> bool:
+    # Copy the user fields discovery filters on onto the profile so queries never need a join.
+    fields = {
+        "name": (user or {}).get("name", ""),
+        "role": (user or {}).get("role"),
+        "blocked": bool((user or {}).get("blocked", False)),
+        "discoverable": is_discoverable(profile, user),
+    }
+    if all(profile.get(key) == value for key, value in fields.items()):
+        return False
+    await db.capstone_profiles.update_one({"_id": profile["_id"]}, {"$set": fields})
+    profile.update(fields)
+    return True
+
+
+async def backfill_denormalized(db) -> None:
+    cursor = db.capstone_profiles.find({"discoverable": {"$exists": False}})
+    async for profile in cursor:
+        user = await db.users.find_one({"_id": profile["user_id"]}, {"name": 1, "role": 1, "blocked": 1})
+        await sync_denormalized(db, profile, user)
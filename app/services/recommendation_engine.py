@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+import numpy as np
+from bson import ObjectId
+from scipy.sparse import csr_matrix
+
+from app.core.config import settings
+from app.services.skill_index import INDEX_PROJECTION
+from app.services.team_service import TEAM_LIMIT
+from app.utils.skills import normalize_skills
+
+logger = logging.getLogger("nya.recommendations")
+
+CACHED_PICKS = 30
+BATCH_ROWS = 256
+
+# Relative weight of each signal in the final score (all signals are in [0, 1]).
+WEIGHT_THEY_HAVE = 0.5
+WEIGHT_I_HAVE = 0.3
+WEIGHT_LOOKING_FOR = 0.1
+WEIGHT_AVAILABILITY = 0.1
+
+_LOOKING_FOR_CODES = {"TEAM": 1, "MEMBER": 2}
+
+
+class RecommendationEngine:
+    # Complementary-skill scoring over sparse have/need vectors for the whole cohort.
+    def __init__(self) -> None:
+        self._rows: dict[ObjectId, dict] = {}
+        self._user_ids: list[ObjectId] = []
+        self._positions: dict[ObjectId, int] = {}
+        self._have: csr_matrix | None = None
+        self._need: csr_matrix | None = None
+        self._need_counts = np.zeros(0, dtype=np.float32)
+        self._looking_for = np.zeros(0, dtype=np.int8)
+        self._availability = np.zeros(0, dtype=np.float32)
+        self._eligible = np.zeros(0, dtype=bool)
+        self._picks: dict[ObjectId, list[tuple[float, ObjectId]]] = {}
+        self._pending: dict[ObjectId, dict | None] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def ensure_loaded(self, db) -> None:
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < settings.recommendation_refresh_seconds:
+            return
+        async with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < settings.recommendation_refresh_seconds:
+                return
+            fresh = RecommendationEngine()
+            async for profile in db.capstone_profiles.find({}, INDEX_PROJECTION):
+                fresh._rows[profile["user_id"]] = fresh._row(profile)
+            await asyncio.to_thread(fresh._build_and_score)
+            self._adopt(fresh)
+            self._picks = fresh._picks
+            self._loaded_at = time.monotonic()
+
+    def recommend(self, user_id: ObjectId, limit: int) -> list[tuple[float, ObjectId]] | None:
+        position = self._positions.get(user_id)
+        if position is None:
+            return None
+        picks = self._picks.get(user_id)
+        if picks is None:
+            picks = self._score_rows(position, position + 1)[0]
+            self._picks[user_id] = picks
+        return picks[:limit]
+
+    def apply(self, user_id: ObjectId, profile: dict | None) -> None:
+        if self._loaded_at is None:
+            return
+        # Profile events are batched: one rebuild, off the event loop, covers every change in the window.
+        self._pending[user_id] = self._row(profile) if profile else None
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        # Updates that arrive while a batch is being applied are picked up by the next pass.
+        while self._pending:
+            await asyncio.sleep(settings.recommendation_apply_delay_seconds)
+            async with self._lock:
+                pending, self._pending = self._pending, {}
+                if self._loaded_at is None:
+                    return
+                try:
+                    await self._apply_pending(pending)
+                except Exception as exc:
+                    logger.warning("Recommendation update failed; changes wait for the next reload: %s", exc)
+
+    async def _apply_pending(self, pending: dict[ObjectId, dict | None]) -> None:
+        fresh = RecommendationEngine()
+        fresh._rows = {**self._rows, **{user_id: row for user_id, row in pending.items() if row}}
+        for user_id, row in pending.items():
+            if row is None:
+                fresh._rows.pop(user_id, None)
+        scores = await asyncio.to_thread(fresh._build_and_score_against, list(pending))
+        self._adopt(fresh)
+        for user_id in pending:
+            self._picks.pop(user_id, None)
+            if user_id not in scores:
+                self._drop_picks_containing(user_id)
+        # Only users whose cached list could change are recomputed, lazily on their next request.
+        for other_id, picks in list(self._picks.items()):
+            other_position = self._positions.get(other_id)
+            if other_position is None:
+                self._picks.pop(other_id, None)
+                continue
+            floor = picks[-1][0] if len(picks) >= CACHED_PICKS else -np.inf
+            for user_id, user_scores in scores.items():
+                if any(pick_id == user_id for _, pick_id in picks) or user_scores[other_position] > floor:
+                    self._picks.pop(other_id, None)
+                    break
+
+    def _build_and_score(self) -> None:
+        self._build()
+        self._picks = self._score_all()
+
+    def _build_and_score_against(self, user_ids: list[ObjectId]) -> dict[ObjectId, np.ndarray]:
+        self._build()
+        return {
+            user_id: self._score_against(self._positions[user_id])
+            for user_id in user_ids
+            if user_id in self._positions
+        }
+
+    def _adopt(self, fresh: RecommendationEngine) -> None:
+        # Swapped in one step on the event loop so readers never see half-built matrices.
+        self._rows, self._user_ids, self._positions = fresh._rows, fresh._user_ids, fresh._positions
+        self._have, self._need, self._need_counts = fresh._have, fresh._need, fresh._need_counts
+        self._looking_for, self._availability, self._eligible = fresh._looking_for, fresh._availability, fresh._eligible
+
+    def _row(self, profile: dict) -> dict:
+        return {
+            "have": profile.get("skills_norm") or normalize_skills(profile.get("skills")),
+            "need": profile.get("required_skills_norm") or normalize_skills(profile.get("required_skills")),
+            "looking_for": _LOOKING_FOR_CODES.get(profile.get("looking_for"), 0),
+            "availability": max(0.0, 1.0 - profile.get("team_count", 0) / TEAM_LIMIT),
+            "eligible": bool(profile.get("discoverable", False)),
+        }
+
+    def _build(self) -> None:
+        self._user_ids = sorted(self._rows)
+        self._positions = {user_id: pos for pos, user_id in enumerate(self._user_ids)}
+        vocabulary: dict[str, int] = {}
+        rows = [self._rows[user_id] for user_id in self._user_ids]
+        self._have = self._matrix([row["have"] for row in rows], vocabulary)
+        self._need = self._matrix([row["need"] for row in rows], vocabulary)
+        self._have.resize((len(rows), max(len(vocabulary), 1)))
+        self._need.resize((len(rows), max(len(vocabulary), 1)))
+        self._need_counts = np.asarray(self._need.sum(axis=1), dtype=np.float32).ravel()
+        self._looking_for = np.array([row["looking_for"] for row in rows], dtype=np.int8)
+        self._availability = np.array([row["availability"] for row in rows], dtype=np.float32)
+        self._eligible = np.array([row["eligible"] for row in rows], dtype=bool)
+
+    def _matrix(self, skill_lists: list[list[str]], vocabulary: dict[str, int]) -> csr_matrix:
+        indptr = [0]
+        indices: list[int] = []
+        for skills in skill_lists:
+            indices.extend(vocabulary.setdefault(skill, len(vocabulary)) for skill in skills)
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.float32)
+        return csr_matrix((data, indices, indptr), shape=(len(skill_lists), max(len(vocabulary), 1)))
+
+    def _score_all(self) -> dict[ObjectId, list[tuple[float, ObjectId]]]:
+        picks: dict[ObjectId, list[tuple[float, ObjectId]]] = {}
+        for start in range(0, len(self._user_ids), BATCH_ROWS):
+            end = min(start + BATCH_ROWS, len(self._user_ids))
+            for offset, row_picks in enumerate(self._score_rows(start, end)):
+                picks[self._user_ids[start + offset]] = row_picks
+        return picks
+
+    def _score_rows(self, start: int, end: int) -> list[list[tuple[float, ObjectId]]]:
+        # scores[i, j]: how well candidate j complements requester i.
+        they_have = (self._need[start:end] @ self._have.T).toarray()
+        i_have = (self._have[start:end] @ self._need.T).toarray()
+        they_have /= np.maximum(self._need_counts[start:end], 1.0)[:, None]
+        i_have /= np.maximum(self._need_counts, 1.0)[None, :]
+        looking = self._looking_for[start:end, None]
+        compatible = (looking != self._looking_for[None, :]) & (looking > 0) & (self._looking_for[None, :] > 0)
+        scores = (
+            WEIGHT_THEY_HAVE * they_have
+            + WEIGHT_I_HAVE * i_have
+            + WEIGHT_LOOKING_FOR * compatible
+            + WEIGHT_AVAILABILITY * self._availability[None, :]
+        )
+        scores[:, ~self._eligible] = -np.inf
+        scores[np.arange(end - start), np.arange(start, end)] = -np.inf
+        return [self._top(row) for row in scores]
+
+    def _score_against(self, position: int) -> np.ndarray:
+        # Scores of every requester for the single candidate at `position`.
+        they_have = np.asarray((self._need @ self._have[position].T).todense(), dtype=np.float32).ravel()
+        i_have = np.asarray((self._have @ self._need[position].T).todense(), dtype=np.float32).ravel()
+        they_have /= np.maximum(self._need_counts, 1.0)
+        i_have /= max(float(self._need_counts[position]), 1.0)
+        candidate_looking = self._looking_for[position]
+        compatible = (self._looking_for != candidate_looking) & (self._looking_for > 0) & (candidate_looking > 0)
+        scores = (
+            WEIGHT_THEY_HAVE * they_have
+            + WEIGHT_I_HAVE * i_have
+            + WEIGHT_LOOKING_FOR * compatible
+            + WEIGHT_AVAILABILITY * self._availability[position]
+        )
+        if not self._eligible[position]:
+            scores[:] = -np.inf
+        scores[position] = -np.inf
+        return scores
+
+    def _top(self, row: np.ndarray) -> list[tuple[float, ObjectId]]:
+        size = min(CACHED_PICKS, row.size)
+        if size == 0:
+            return []
+        candidates = np.argpartition(-row, size - 1)[:size]
+        ordered = sorted(candidates, key=lambda pos: (-row[pos], self._user_ids[pos]))
+        return [(float(row[pos]), self._user_ids[pos]) for pos in ordered if np.isfinite(row[pos])]
+
+    def _drop_picks_containing(self, user_id: ObjectId) -> None:
+        for other_id, picks in list(self._picks.items()):
+            if any(pick_id == user_id for _, pick_id in picks):
+                self._picks.pop(other_id, None)
+
+
+recommendation_engine = RecommendationEngine()
@@ -6,16 +6,22 @@ from bson import ObjectId
 
 from app.utils.errors import AppError
 from app.utils.mongo import normalize_id
+from app.utils.pagination import decode_cursor, encode_cursor
 from app.core.config import settings
 from app.services.email_service import EmailService
 from app.services.mentor_email_template_service import MentorEmailTemplateService
+from app.services.notification_digest_service import NotificationDigestService
+from app.services.profile_events import profile_changed
+from app.services.team_service import TEAM_LIMIT, TeamService
 
 
 class RequestService:
     def __init__(self, db):
         self.db = db
-        self.email_service = EmailService()
+        self.email_service = EmailService(db)
         self.mentor_email_templates = MentorEmailTemplateService(db)
+        self.digests = NotificationDigestService(db)
+        self.team_service = TeamService(db)
 
     async def create_request(self, from_user: dict, to_user_id: str, request_type: str, message: str) -> dict:
         if not ObjectId.is_valid(to_user_id):
@@ -66,11 +72,51 @@ class RequestService:
 
     async def list_incoming(self, user_id: str) -> list[dict]:
         cursor = self.db.requests.find({"to_user_id": ObjectId(user_id)}).sort("created_at", -1)
-        return await self._decorate_requests(cursor, user_id, incoming=True)
+        return await self._decorate_requests([doc async for doc in cursor], user_id, incoming=True)
 
     async def list_outgoing(self, user_id: str) -> list[dict]:
         cursor = self.db.requests.find({"from_user_id": ObjectId(user_id)}).sort("created_at", -1)
-        return await self._decorate_requests(cursor, user_id, incoming=False)
+        return await self._decorate_requests([doc async for doc in cursor], user_id, incoming=False)
+
+    async def list_page(
+        self,
+        user_id: str,
+        incoming: bool,
+        status: str | None = None,
+        request_type: str | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> dict:
+        owner_field = "to_user_id" if incoming else "from_user_id"
+        base_query: dict = {owner_field: ObjectId(user_id)}
+        if request_type:
+            base_query["type"] = request_type
+        query = dict(base_query)
+        if status:
+            query["status"] = status
+        if cursor:
+            created_at, last_id = self._decode_inbox_cursor(cursor)
+            query["$or"] = [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "_id": {"$lt": last_id}},
+            ]
+        page_cursor = self.db.requests.find(query).sort([("created_at", -1), ("_id", -1)]).limit(limit + 1)
+        docs = [doc async for doc in page_cursor]
+
+        next_cursor = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            last = docs[-1]
+            next_cursor = encode_cursor({"created_at": last["created_at"].isoformat(), "id": str(last["_id"])})
+
+        counts = {"PENDING": 0, "ACCEPTED": 0, "REJECTED": 0}
+        pipeline = [{"$match": base_query}, {"$group": {"_id": "$status", "count": {"$sum": 1}}}]
+        async for row in self.db.requests.aggregate(pipeline):
+            if row["_id"] in counts:
+                counts[row["_id"]] = row["count"]
+
+        items = await self._decorate_requests(docs, user_id, incoming=incoming)
+        return {"items": items, "next_cursor": next_cursor, "counts": counts}
 
     async def accept_request(self, request_id: str, user_id: str) -> dict:
         request = await self._get_request_for_recipient(request_id, user_id)
@@ -78,9 +124,19 @@ class RequestService:
             return self._format_request(request)
         if request["status"] != "PENDING":
             raise AppError(400, "invalid_status", "Request is not pending")
+        reserved: list[ObjectId] = []
         if request.get("type") == "CAPSTONE":
-            await self._ensure_team_capacity(request, user_id)
-        await self.db.requests.update_one({"_id": ObjectId(request_id)}, {"$set": {"status": "ACCEPTED"}})
+            reserved = await self._reserve_team_slots(request, user_id)
+        result = await self.db.requests.update_one(
+            {"_id": ObjectId(request_id), "status": "PENDING"},
+            {"$set": {"status": "ACCEPTED"}},
+        )
+        if not result.modified_count:
+            for member_id in reserved:
+                await self.team_service.release_slot(member_id)
+            raise AppError(409, "invalid_status", "Request is no longer pending")
+        for member_id in reserved:
+            await profile_changed(self.db, member_id)
         updated = await self.db.requests.find_one({"_id": ObjectId(request_id)})
         if request.get("type") == "MENTORSHIP":
             await self._notify_mentor_request_accepted(request)
@@ -106,12 +162,17 @@ class RequestService:
             raise AppError(404, "request_not_found", "Request not found")
         return normalize_id(request)
 
-    async def _decorate_requests(self, cursor, user_id: str, incoming: bool) -> list[dict]:
+    async def _decorate_requests(self, docs: list[dict], user_id: str, incoming: bool) -> list[dict]:
+        requests = [normalize_id(doc) for doc in docs]
+        counterpart_field = "from_user_id" if incoming else "to_user_id"
+        counterpart_ids = list({req[counterpart_field] for req in requests})
+        users_by_id = {}
+        if counterpart_ids:
+            user_cursor = self.db.users.find({"_id": {"$in": counterpart_ids}}, {"name": 1, "role": 1, "email": 1})
+            users_by_id = {user["_id"]: user async for user in user_cursor}
         results = []
-        async for doc in cursor:
-            req = normalize_id(doc)
-            counterpart_id = req["from_user_id"] if incoming else req["to_user_id"]
-            user = await self.db.users.find_one({"_id": counterpart_id})
+        for req in requests:
+            user = users_by_id.get(req[counterpart_field])
             if not user:
                 continue
             email = user["email"] if req["status"] == "ACCEPTED" else None
@@ -131,6 +192,17 @@ class RequestService:
             )
         return results
 
+    def _decode_inbox_cursor(self, cursor: str) -> tuple[datetime, ObjectId]:
+        state = decode_cursor(cursor)
+        try:
+            created_at = datetime.fromisoformat(state["created_at"])
+        except (KeyError, TypeError, ValueError):
+            raise AppError(400, "invalid_cursor", "Invalid pagination cursor")
+        last_id = state.get("id")
+        if not isinstance(last_id, str) or not ObjectId.is_valid(last_id):
+            raise AppError(400, "invalid_cursor", "Invalid pagination cursor")
+        return created_at, ObjectId(last_id)
+
     def _format_request(self, request: dict) -> dict:
         return {
             "id": request["id"],
@@ -147,6 +219,11 @@ class RequestService:
             return
         base_url = settings.frontend_origin or "http://localhost:8000"
         try:
+            if to_user.get("notification_mode") == "DIGEST":
+                await self.digests.add(
+                    to_user, "request_created", from_user.get("name", ""), message or "", f"{base_url}/requests"
+                )
+                return
             await self.email_service.send_request_created(
                 recipient_email=to_user["email"],
                 recipient_name=to_user.get("name", ""),
@@ -185,6 +262,15 @@ class RequestService:
             return
         base_url = settings.frontend_origin or "http://localhost:8000"
         try:
+            if to_user.get("notification_mode") == "DIGEST":
+                await self.digests.add(
+                    to_user,
+                    "mentor_request_created",
+                    from_user.get("name", ""),
+                    message or "",
+                    f"{base_url}/mentor/dashboard",
+                )
+                return
             mentor_id = str(to_user.get("id") or to_user.get("_id"))
             html_body = await self.mentor_email_templates.render_with_context(
                 mentor_id,
@@ -228,36 +314,15 @@ class RequestService:
         except Exception:
             return
 
-    async def _ensure_team_capacity(self, request: dict, user_id: str) -> None:
-        to_id = request["to_user_id"]
+    async def _reserve_team_slots(self, request: dict, user_id: str) -> list[ObjectId]:
         from_id = request["from_user_id"]
-        if not isinstance(to_id, ObjectId):
-            to_id = ObjectId(to_id)
         if not isinstance(from_id, ObjectId):
             from_id = ObjectId(from_id)
         recipient_id = ObjectId(user_id)
 
-        team_limit = 5
-        base_query = {
-            "status": "ACCEPTED",
-            "type": "CAPSTONE",
-            "$or": [
-                {"from_user_id": recipient_id},
-                {"to_user_id": recipient_id},
-            ],
-        }
-        recipient_count = await self.db.requests.count_documents(base_query)
-        if recipient_count >= team_limit:
-            raise AppError(400, "team_full", "Your team already has 5 members")
-
-        other_query = {
-            "status": "ACCEPTED",
-            "type": "CAPSTONE",
-            "$or": [
-                {"from_user_id": from_id},
-                {"to_user_id": from_id},
-            ],
-        }
-        other_count = await self.db.requests.count_documents(other_query)
-        if other_count >= team_limit:
+        if not await self.team_service.reserve_slot(recipient_id):
+            raise AppError(400, "team_full", f"Your team already has {TEAM_LIMIT} members")
+        if not await self.team_service.reserve_slot(from_id):
+            await self.team_service.release_slot(recipient_id)
             raise AppError(400, "team_full", "This member already has a full team")
+        return [recipient_id, from_id]
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+
+from bson import ObjectId
+
+from app.core.config import settings
+from app.utils.skills import normalize_skills
+
+INDEX_PROJECTION = {
+    "user_id": 1,
+    "skills": 1,
+    "skills_norm": 1,
+    "required_skills": 1,
+    "required_skills_norm": 1,
+    "looking_for": 1,
+    "mentor_assigned": 1,
+    "team_count": 1,
+    "discoverable": 1,
+}
+
+
+class SkillIndex:
+    # In-process inverted index: normalized skill -> sorted array of profile ordinals.
+    def __init__(self) -> None:
+        self._entries: list[dict | None] = []
+        self._ordinals: dict[ObjectId, int] = {}
+        self._postings: dict[str, array] = {}
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def ensure_loaded(self, db) -> None:
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < settings.skill_index_refresh_seconds:
+            return
+        async with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < settings.skill_index_refresh_seconds:
+                return
+            await self._rebuild(db)
+
+    def apply(self, user_id: ObjectId, profile: dict | None) -> None:
+        if self._loaded_at is None:
+            return
+        if profile:
+            self.upsert(profile)
+        else:
+            self.remove(user_id)
+
+    def upsert(self, profile: dict) -> None:
+        user_id = profile["user_id"]
+        entry = {
+            "user_id": user_id,
+            "skills": tuple(profile.get("skills_norm") or normalize_skills(profile.get("skills"))),
+            "looking_for": profile.get("looking_for"),
+            "mentor_assigned": bool(profile.get("mentor_assigned", False)),
+            "discoverable": bool(profile.get("discoverable", False)),
+        }
+        ordinal = self._ordinals.get(user_id)
+        if ordinal is None:
+            ordinal = len(self._entries)
+            self._entries.append(None)
+            self._ordinals[user_id] = ordinal
+        else:
+            self._unlink(ordinal)
+        self._entries[ordinal] = entry
+        for skill in entry["skills"]:
+            postings = self._postings.setdefault(skill, array("I"))
+            insort(postings, ordinal)
+
+    def remove(self, user_id: ObjectId) -> None:
+        ordinal = self._ordinals.get(user_id)
+        if ordinal is None:
+            return
+        self._unlink(ordinal)
+        self._entries[ordinal] = None
+
+    def rank(
+        self,
+        terms: list[str],
+        *,
+        exclude: ObjectId | None = None,
+        looking_for: str | None = None,
+        mentor_assigned: bool | None = None,
+        extra_ids: list[ObjectId] | None = None,
+    ) -> Counter:
+        # Overlap counts for every discoverable profile sharing a term (or named in extra_ids).
+        counts: Counter = Counter()
+        for term in terms:
+            for ordinal in self._postings.get(term, ()):
+                counts[ordinal] += 1
+        for user_id in extra_ids or []:
+            ordinal = self._ordinals.get(user_id)
+            if ordinal is not None:
+                counts[ordinal] += 0
+        for ordinal in list(counts):
+            entry = self._entries[ordinal]
+            if (
+                entry is None
+                or not entry["discoverable"]
+                or entry["user_id"] == exclude
+                or (looking_for and entry["looking_for"] != looking_for)
+                or (mentor_assigned is not None and entry["mentor_assigned"] != mentor_assigned)
+            ):
+                del counts[ordinal]
+        return counts
+
+    def top_k(
+        self,
+        counts: Counter,
+        k: int,
+        *,
+        skip: int = 0,
+        after: tuple[int, ObjectId] | None = None,
+    ) -> list[tuple[int, ObjectId]]:
+        # Ordered by overlap desc, then user_id asc; matches the database sort for unranked pages.
+        keyed = ((-score, self._entries[ordinal]["user_id"]) for ordinal, score in counts.items())
+        if after:
+            bound = (-after[0], after[1])
+            keyed = (key for key in keyed if key > bound)
+        best = heapq.nsmallest(skip + k, keyed)
+        return [(-neg_score, user_id) for neg_score, user_id in best[skip:]]
+
+    def _unlink(self, ordinal: int) -> None:
+        entry = self._entries[ordinal]
+        if entry is None:
+            return
+        for skill in entry["skills"]:
+            postings = self._postings.get(skill)
+            if postings is None:
+                continue
+            pos = bisect_left(postings, ordinal)
+            if pos < len(postings) and postings[pos] == ordinal:
+                del postings[pos]
+            if not postings:
+                del self._postings[skill]
+
+    async def _rebuild(self, db) -> None:
+        # Build off to the side and swap so readers never see a half-loaded index.
+        fresh = SkillIndex()
+        async for profile in db.capstone_profiles.find({}, INDEX_PROJECTION).sort("user_id", 1):
+            fresh.upsert(profile)
+        self._entries, self._ordinals, self._postings = fresh._entries, fresh._ordinals, fresh._postings
+        self._loaded_at = time.monotonic()
+
+
+skill_index = SkillIndex()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from bisect import bisect_left, insort
+from collections import Counter
+
+from bson import ObjectId
+
+from app.core.config import settings
+from app.utils.skills import normalize_skill
+
+
+class SkillSuggester:
+    # Sorted array of normalized skills + bisect for prefix lookups, weighted by how many profiles use each.
+    def __init__(self) -> None:
+        self._keys: list[str] = []
+        self._counts: Counter = Counter()
+        self._spellings: dict[str, Counter] = {}
+        self._sources: dict[tuple[str, ObjectId], list[str]] = {}
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def ensure_loaded(self, db) -> None:
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < settings.skill_index_refresh_seconds:
+            return
+        async with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < settings.skill_index_refresh_seconds:
+                return
+            fresh = SkillSuggester()
+            async for doc in db.capstone_profiles.find({}, {"user_id": 1, "skills": 1, "required_skills": 1}):
+                fresh._set_source("capstone", doc["user_id"], self._capstone_skills(doc))
+            async for doc in db.mentor_profiles.find({}, {"user_id": 1, "expertise": 1}):
+                fresh._set_source("mentor", doc["user_id"], doc.get("expertise") or [])
+            self._keys, self._counts = fresh._keys, fresh._counts
+            self._spellings, self._sources = fresh._spellings, fresh._sources
+            self._loaded_at = time.monotonic()
+
+    def apply_capstone(self, user_id: ObjectId, profile: dict | None) -> None:
+        if self._loaded_at is not None:
+            self._set_source("capstone", user_id, self._capstone_skills(profile) if profile else [])
+
+    def apply_mentor(self, user_id: ObjectId, profile: dict | None) -> None:
+        if self._loaded_at is not None:
+            self._set_source("mentor", user_id, (profile or {}).get("expertise") or [])
+
+    def suggest(self, query: str, limit: int) -> list[dict]:
+        prefix = normalize_skill(query)
+        if not prefix:
+            return []
+        start = bisect_left(self._keys, prefix)
+        end = bisect_left(self._keys, prefix + "\uffff", lo=start)
+        best = heapq.nsmallest(limit, self._keys[start:end], key=lambda key: (-self._counts[key], key))
+        return [{"name": self._spellings[key].most_common(1)[0][0], "count": self._counts[key]} for key in best]
+
+    def _capstone_skills(self, profile: dict) -> list[str]:
+        return [*(profile.get("skills") or []), *(profile.get("required_skills") or [])]
+
+    def _set_source(self, kind: str, user_id: ObjectId, skills: list[str]) -> None:
+        key = (kind, user_id)
+        for spelling in self._sources.pop(key, []):
+            self._remove(spelling)
+        by_key: dict[str, str] = {}
+        for skill in skills:
+            spelling = " ".join(str(skill).split())
+            if spelling:
+                by_key.setdefault(normalize_skill(spelling), spelling)
+        cleaned = list(by_key.values())
+        if cleaned:
+            self._sources[key] = cleaned
+        for spelling in cleaned:
+            self._add(spelling)
+
+    def _add(self, spelling: str) -> None:
+        normalized = normalize_skill(spelling)
+        if not self._counts[normalized]:
+            insort(self._keys, normalized)
+        self._counts[normalized] += 1
+        self._spellings.setdefault(normalized, Counter())[spelling] += 1
+
+    def _remove(self, spelling: str) -> None:
+        normalized = normalize_skill(spelling)
+        self._counts[normalized] -= 1
+        spellings = self._spellings[normalized]
+        spellings[spelling] -= 1
+        if spellings[spelling] <= 0:
+            del spellings[spelling]
+        if self._counts[normalized] <= 0:
+            del self._counts[normalized]
+            del self._spellings[normalized]
+            pos = bisect_left(self._keys, normalized)
+            if pos < len(self._keys) and self._keys[pos] == normalized:
+                del self._keys[pos]
+
+
+skill_suggester = SkillSuggester()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from app.core.config import settings
+from app.services.smtp_pool import HEALTH_CHECK_IDLE_SECONDS
+
+try:
+    import aiosmtplib
+except ImportError:  # pragma: no cover - the thread pool in smtp_pool covers this case
+    aiosmtplib = None
+
+
+class _AsyncSession:
+    def __init__(self, client) -> None:
+        self.client = client
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+        self.sent = 0
+
+
+class AsyncSMTPPool:
+    # Event-loop SMTP sessions, so bursts of mail don't occupy the default thread pool.
+    def __init__(self, max_size: int, max_messages: int, max_age_seconds: float, timeout_seconds: float) -> None:
+        self.max_size = max(max_size, 1)
+        self.max_messages = max_messages
+        self.max_age_seconds = max_age_seconds
+        self.timeout_seconds = timeout_seconds
+        self._slots = asyncio.Semaphore(self.max_size)
+        self._idle: list[_AsyncSession] = []
+
+    def available(self) -> bool:
+        return aiosmtplib is not None
+
+    async def send(self, from_addr: str, to_addrs: list[str], message: str) -> None:
+        errors = await self.send_many([(from_addr, to_addrs, message)])
+        if errors[0] is not None:
+            raise errors[0]
+
+    async def send_many(
+        self,
+        messages: list[tuple[str, list[str], str]],
+        on_result: Callable[[int, Exception | None], Awaitable[None]] | None = None,
+    ) -> list[Exception | None]:
+        errors: list[Exception | None] = []
+        async with self._slots:
+            session = None
+            try:
+                for from_addr, to_addrs, message in messages:
+                    try:
+                        session = session or await self._checkout()
+                        session = await self._send_with_retry(session, from_addr, to_addrs, message)
+                        errors.append(None)
+                    except Exception as exc:
+                        if session is not None:
+                            await self._discard(session)
+                            session = None
+                        errors.append(exc)
+                    if on_result is not None:
+                        await on_result(len(errors) - 1, errors[-1])
+                    if session is not None and self._expired(session):
+                        await self._discard(session)
+                        session = None
+            except BaseException:
+                # Cancelled mid-command: the protocol state is unknown, so the connection is not reused.
+                if session is not None:
+                    session.client.close()
+                raise
+            if session is not None:
+                self._idle.append(session)
+        return errors
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for session in idle:
+            await self._discard(session)
+
+    async def _send_with_retry(
+        self, session: _AsyncSession, from_addr: str, to_addrs: list[str], message: str
+    ) -> _AsyncSession:
+        try:
+            await session.client.sendmail(from_addr, to_addrs, message)
+        except aiosmtplib.SMTPServerDisconnected:
+            await self._discard(session)
+            session = await self._connect()
+            await session.client.sendmail(from_addr, to_addrs, message)
+        session.sent += 1
+        session.last_used_at = time.monotonic()
+        return session
+
+    async def _checkout(self) -> _AsyncSession:
+        while self._idle:
+            session = self._idle.pop()
+            if not self._expired(session) and await self._healthy(session):
+                return session
+            await self._discard(session)
+        return await self._connect()
+
+    def _expired(self, session: _AsyncSession) -> bool:
+        return (
+            session.sent >= self.max_messages
+            or time.monotonic() - session.created_at >= self.max_age_seconds
+        )
+
+    async def _healthy(self, session: _AsyncSession) -> bool:
+        if not session.client.is_connected:
+            return False
+        if time.monotonic() - session.last_used_at < HEALTH_CHECK_IDLE_SECONDS:
+            return True
+        try:
+            return (await session.client.noop()).code == 250
+        except (aiosmtplib.SMTPException, OSError):
+            return False
+
+    async def _connect(self) -> _AsyncSession:
+        client = aiosmtplib.SMTP(
+            hostname=settings.smtp_host,
+            port=settings.smtp_port,
+            timeout=self.timeout_seconds,
+            use_tls=not settings.smtp_use_starttls,
+            start_tls=settings.smtp_use_starttls,
+        )
+        await client.connect()
+        try:
+            await client.login(settings.smtp_user, settings.smtp_password)
+        except Exception:
+            client.close()
+            raise
+        return _AsyncSession(client)
+
+    async def _discard(self, session: _AsyncSession) -> None:
+        try:
+            await session.client.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            session.client.close()
+
+
+async_smtp_pool = AsyncSMTPPool(
+    max_size=settings.smtp_pool_size,
+    max_messages=settings.smtp_session_max_messages,
+    max_age_seconds=settings.smtp_session_max_age_seconds,
+    timeout_seconds=settings.smtp_timeout_seconds,
+)
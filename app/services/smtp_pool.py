@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import smtplib
+import threading
+import time
+from typing import Callable
+
+from app.core.config import settings
+
+# Idle sessions older than this get a NOOP before reuse; servers drop quiet connections without telling us.
+HEALTH_CHECK_IDLE_SECONDS = 5.0
+
+
+class _Session:
+    def __init__(self, server: smtplib.SMTP) -> None:
+        self.server = server
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+        self.sent = 0
+
+
+class SMTPConnectionPool:
+    # Bounded pool of logged-in SMTP sessions shared by the threads that send mail.
+    def __init__(self, max_size: int, max_messages: int, max_age_seconds: float) -> None:
+        self.max_size = max(max_size, 1)
+        self.max_messages = max_messages
+        self.max_age_seconds = max_age_seconds
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._idle: list[_Session] = []
+        self._lock = threading.Lock()
+
+    def send(self, from_addr: str, to_addrs: list[str], message: str) -> None:
+        errors = self.send_many([(from_addr, to_addrs, message)])
+        if errors[0] is not None:
+            raise errors[0]
+
+    def send_many(
+        self,
+        messages: list[tuple[str, list[str], str]],
+        on_result: Callable[[int, Exception | None], None] | None = None,
+    ) -> list[Exception | None]:
+        # Pushes every message over as few sessions as possible; one failure does not abort the rest.
+        # on_result(index, error) runs as soon as each message is done, before the next one starts.
+        errors: list[Exception | None] = []
+        with self._slots:
+            session = None
+            try:
+                for from_addr, to_addrs, message in messages:
+                    try:
+                        session = session or self._checkout()
+                        session = self._send_with_retry(session, from_addr, to_addrs, message)
+                        errors.append(None)
+                    except Exception as exc:
+                        if session is not None:
+                            self._discard(session)
+                            session = None
+                        errors.append(exc)
+                    if on_result is not None:
+                        on_result(len(errors) - 1, errors[-1])
+                    if session is not None and self._expired(session):
+                        self._discard(session)
+                        session = None
+            finally:
+                if session is not None:
+                    self._checkin(session)
+        return errors
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for session in idle:
+            self._discard(session)
+
+    def _send_with_retry(self, session: _Session, from_addr: str, to_addrs: list[str], message: str) -> _Session:
+        try:
+            session.server.sendmail(from_addr, to_addrs, message)
+        except smtplib.SMTPServerDisconnected:
+            # A pooled session can die between the health check and the send; retry once on a fresh one.
+            self._discard(session)
+            session = self._connect()
+            session.server.sendmail(from_addr, to_addrs, message)
+        session.sent += 1
+        session.last_used_at = time.monotonic()
+        return session
+
+    def _checkout(self) -> _Session:
+        while True:
+            with self._lock:
+                session = self._idle.pop() if self._idle else None
+            if session is None:
+                return self._connect()
+            if self._expired(session) or not self._healthy(session):
+                self._discard(session)
+                continue
+            return session
+
+    def _checkin(self, session: _Session) -> None:
+        with self._lock:
+            self._idle.append(session)
+
+    def _expired(self, session: _Session) -> bool:
+        return (
+            session.sent >= self.max_messages
+            or time.monotonic() - session.created_at >= self.max_age_seconds
+        )
+
+    def _healthy(self, session: _Session) -> bool:
+        if time.monotonic() - session.last_used_at < HEALTH_CHECK_IDLE_SECONDS:
+            return True
+        try:
+            return session.server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _connect(self) -> _Session:
+        if settings.smtp_use_starttls:
+            server = smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=settings.smtp_timeout_seconds)
+            try:
+                server.ehlo()
+                server.starttls()
+                server.ehlo()
+                server.login(settings.smtp_user, settings.smtp_password)
+            except Exception:
+                server.close()
+                raise
+        else:
+            server = smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port, timeout=settings.smtp_timeout_seconds)
+            try:
+                server.login(settings.smtp_user, settings.smtp_password)
+            except Exception:
+                server.close()
+                raise
+        return _Session(server)
+
+    def _discard(self, session: _Session) -> None:
+        try:
+            session.server.quit()
+        except (smtplib.SMTPException, OSError):
+            session.server.close()
+
+
+smtp_pool = SMTPConnectionPool(
+    max_size=settings.smtp_pool_size,
+    max_messages=settings.smtp_session_max_messages,
+    max_age_seconds=settings.smtp_session_max_age_seconds,
+)
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import datetime, timezone
 from typing import Any
 
+from app.core.config import settings
+from app.utils.cache import EpochTTLCache
 from app.utils.errors import AppError
 
 
@@ -34,16 +38,40 @@ DEFAULT_STORIES = [
 ]
 
 
+FEED_KEY = "main_dashboard"
+
+# FEED_KEY -> (payload, etag). Once the TTL lapses only updated_at is re-read and the full
+# document is reloaded only when it moved, which keeps other workers' edits visible.
+story_cache = EpochTTLCache(ttl_seconds=settings.stories_cache_ttl_seconds)
+
+
 class StoryService:
     def __init__(self, db):
         self.collection = db.stories
 
     async def list_stories(self) -> dict[str, Any]:
-        doc = await self.collection.find_one({"_id": "main_dashboard"})
+        payload, _etag = await self.get_feed()
+        return payload
+
+    async def get_feed(self) -> tuple[dict[str, Any], str]:
+        hit, cached = story_cache.get(FEED_KEY)
+        if hit:
+            return cached
+        epoch = story_cache.epoch
+        stale = story_cache.peek(FEED_KEY)
+        if stale is not None:
+            stamp = await self.collection.find_one({"_id": FEED_KEY}, {"updated_at": 1})
+            if (stamp or {}).get("updated_at") == stale[0]["updated_at"]:
+                story_cache.put(FEED_KEY, stale, epoch)
+                return stale
+        doc = await self.collection.find_one({"_id": FEED_KEY})
         items = doc.get("items") if doc else DEFAULT_STORIES
         updated_at = doc.get("updated_at") if doc else None
-        items = self._normalize_items(items)
-        return {"items": items, "updated_at": updated_at}
+        payload = {"items": self._normalize_items(items), "updated_at": updated_at}
+        digest = hashlib.sha256(json.dumps(payload, default=str).encode()).hexdigest()[:16]
+        etag = f'"{digest}"'
+        story_cache.put(FEED_KEY, (payload, etag), epoch)
+        return payload, etag
 
     async def update_stories(self, items: list[dict[str, Any]]) -> dict[str, Any]:
         if len(items) != 4:
@@ -51,10 +79,11 @@ class StoryService:
         items = self._normalize_items(items)
         updated_at = datetime.now(timezone.utc)
         await self.collection.update_one(
-            {"_id": "main_dashboard"},
+            {"_id": FEED_KEY},
             {"$set": {"items": items, "updated_at": updated_at}},
             upsert=True,
         )
+        story_cache.discard(FEED_KEY)
         return {"items": items, "updated_at": updated_at}
 
     def _normalize_items(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from bson import ObjectId
+
+
+TEAM_LIMIT = 5
+
+
+def team_status_for(count: int) -> str:
+    if count <= 0:
+        return "AVAILABLE"
+    if count >= TEAM_LIMIT:
+        return "BOOKED"
+    return "IN_TEAM"
+
+
+def _team_status_expr(count_expr) -> dict:
+    return {
+        "$switch": {
+            "branches": [
+                {"case": {"$lte": [count_expr, 0]}, "then": "AVAILABLE"},
+                {"case": {"$gte": [count_expr, TEAM_LIMIT]}, "then": "BOOKED"},
+            ],
+            "default": "IN_TEAM",
+        }
+    }
+
+
+class TeamService:
+    # Maintains the materialized team_count/team_status on capstone profiles.
+    def __init__(self, db):
+        self.db = db
+
+    async def reserve_slot(self, user_id: ObjectId) -> bool:
+        # Conditional increment: only succeeds while the team is below the cap.
+        result = await self.db.capstone_profiles.update_one(
+            {
+                "user_id": user_id,
+                "$or": [{"team_count": {"$lt": TEAM_LIMIT}}, {"team_count": {"$exists": False}}],
+            },
+            self._adjust_pipeline(1),
+        )
+        if result.matched_count:
+            return True
+        # Users without a capstone profile (e.g. admins) have no counter to maintain.
+        exists = await self.db.capstone_profiles.find_one({"user_id": user_id}, {"_id": 1})
+        return exists is None
+
+    async def release_slot(self, user_id: ObjectId) -> None:
+        await self.db.capstone_profiles.update_one(
+            {"user_id": user_id, "team_count": {"$gt": 0}},
+            self._adjust_pipeline(-1),
+        )
+
+    async def recount(self, user_id: ObjectId) -> int:
+        count = await self.db.requests.count_documents(self._accepted_query(user_id))
+        await self.db.capstone_profiles.update_one(
+            {"user_id": user_id},
+            {"$set": {"team_count": count, "team_status": team_status_for(count)}},
+        )
+        return count
+
+    async def backfill_missing(self) -> None:
+        cursor = self.db.capstone_profiles.find({"team_count": {"$exists": False}}, {"user_id": 1})
+        async for doc in cursor:
+            await self.recount(doc["user_id"])
+
+    def _accepted_query(self, user_id: ObjectId) -> dict:
+        return {
+            "status": "ACCEPTED",
+            "type": "CAPSTONE",
+            "$or": [
+                {"from_user_id": user_id},
+                {"to_user_id": user_id},
+            ],
+        }
+
+    def _adjust_pipeline(self, delta: int) -> list[dict]:
+        new_count = {"$add": [{"$ifNull": ["$team_count", 0]}, delta]}
+        return [
+            {"$set": {"team_count": new_count}},
+            {"$set": {"team_status": _team_status_expr("$team_count")}},
+        ]
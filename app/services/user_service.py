@@ -4,7 +4,19 @@ from datetime import datetime, timezone
 
 from bson import ObjectId
 
+from app.core.config import settings
+from app.services.profile_events import profile_changed
+from app.utils.cache import AsyncLRUCache
 from app.utils.mongo import normalize_id
+from app.utils.search import name_prefixes
+
+# Identity lookups for get_current_user. Writes to a user in this process discard the entry;
+# the TTL bounds staleness (e.g. blocking) for writes made by other workers.
+user_cache = AsyncLRUCache(
+    max_entries=settings.user_cache_max_entries,
+    max_bytes=settings.user_cache_max_entries * 2048,
+    ttl_seconds=settings.user_cache_ttl_seconds,
+)
 
 
 class UserService:
@@ -15,6 +27,10 @@ class UserService:
         doc = await self.db.users.find_one({"_id": ObjectId(user_id)})
         return normalize_id(doc) if doc else None
 
+    async def get_cached_user(self, user_id: str) -> dict | None:
+        user = await user_cache.get_or_set(user_id, lambda: self.get_user_by_id(user_id))
+        return dict(user) if user else None
+
     async def get_user_by_email(self, email: str) -> dict | None:
         doc = await self.db.users.find_one({"email": email})
         return normalize_id(doc) if doc else None
@@ -24,6 +40,7 @@ class UserService:
         result = await self.db.users.insert_one(
             {
                 "name": name,
+                "name_prefixes": name_prefixes(name),
                 "email": email,
                 "role": role,
                 "role_selected": role_selected,
@@ -38,10 +55,13 @@ class UserService:
         update: dict[str, object] = {"role": role}
         if role_selected is not None:
             update["role_selected"] = role_selected
-        await self.db.users.update_one({"_id": ObjectId(user_id)}, {"$set": update})
+        await self.db.users.update_one({"_id": ObjectId(user_id)}, {"$set": update, "$inc": {"auth_version": 1}})
+        user_cache.discard(user_id)
+        await profile_changed(self.db, ObjectId(user_id))
 
     async def update_last_login(self, user_id: str) -> None:
         await self.db.users.update_one({"_id": ObjectId(user_id)}, {"$set": {"last_login": datetime.now(tz=timezone.utc)}})
+        user_cache.discard(user_id)
 
     async def get_session_user(self, user: dict) -> dict:
         return {
@@ -52,9 +72,24 @@ class UserService:
             "last_login": user["last_login"],
         }
 
+    async def bump_auth_version(self, user_id: str) -> None:
+        # Revokes onboarding claims in every access token issued so far for this user.
+        await self.db.users.update_one({"_id": ObjectId(user_id)}, {"$inc": {"auth_version": 1}})
+        user_cache.discard(user_id)
+
+    async def get_notification_mode(self, user: dict) -> dict:
+        return {"mode": user.get("notification_mode") or "IMMEDIATE"}
+
+    async def set_notification_mode(self, user_id: str, mode: str) -> dict:
+        await self.db.users.update_one({"_id": ObjectId(user_id)}, {"$set": {"notification_mode": mode}})
+        user_cache.discard(user_id)
+        return {"mode": mode}
+
     async def set_role(self, user_id: str, role: str) -> dict:
         await self.db.users.update_one(
             {"_id": ObjectId(user_id)},
-            {"$set": {"role": role, "role_selected": True}},
+            {"$set": {"role": role, "role_selected": True}, "$inc": {"auth_version": 1}},
         )
+        user_cache.discard(user_id)
+        await profile_changed(self.db, ObjectId(user_id))
         return await self.get_user_by_id(user_id)
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import threading
+from pathlib import Path
+
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+
+from app.utils.media import LOW_BITRATE_QUALITY, MEDIA_SUFFIXES, low_bitrate_path, media_response
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - gzip siblings are still produced and served
+    brotli = None
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "public, no-cache"
+PRIVATE_CACHE = "private, no-cache"
+COMPRESSIBLE_SUFFIXES = {".html", ".js", ".css", ".json", ".svg", ".txt"}
+# Preferred first; the suffix is the sibling file extension next to the source.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+logger = logging.getLogger("nya.assets")
+
+
+def precompress(path: Path) -> dict[str, Path]:
+    # Build step (scripts/precompress_pages.py): writes or refreshes .gz/.br siblings for a text file.
+    source = path.read_bytes()
+    source_mtime = path.stat().st_mtime_ns
+    variants: dict[str, Path] = {}
+    for encoding, suffix in ENCODINGS:
+        if encoding == "br" and brotli is None:
+            continue
+        sibling = path.with_name(path.name + suffix)
+        try:
+            if not sibling.exists() or sibling.stat().st_mtime_ns < source_mtime:
+                if encoding == "br":
+                    data = brotli.compress(source, quality=11)
+                else:
+                    data = gzip.compress(source, compresslevel=9, mtime=0)
+                if len(data) >= len(source):
+                    continue
+                tmp = sibling.with_name(sibling.name + ".tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, sibling)
+        except OSError as exc:
+            logger.warning("Could not precompress %s: %s", path, exc)
+            continue
+        variants[encoding] = sibling
+    return variants
+
+
+def compressed_siblings(path: Path) -> dict[str, Path]:
+    # Read-only counterpart used at serve time: siblings older than their source are ignored.
+    try:
+        source_mtime = path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    variants: dict[str, Path] = {}
+    for encoding, suffix in ENCODINGS:
+        sibling = path.with_name(path.name + suffix)
+        try:
+            if sibling.stat().st_mtime_ns >= source_mtime:
+                variants[encoding] = sibling
+        except OSError:
+            continue
+    return variants
+
+
+def accepted_encodings(request: Request) -> set[str]:
+    accepted = set()
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.strip().partition(";")
+        q = params.strip().removeprefix("q=")
+        try:
+            if params and float(q) <= 0:
+                continue
+        except ValueError:
+            continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+class AssetManifest:
+    # URL -> file metadata (size, mtime, content hash, MIME type), built once and looked up per request.
+    # Every file is also reachable under a content-hashed URL (name.<hash>.ext) that can be cached forever.
+    # With precompressed, fresh .gz/.br siblings of text files are served to clients that accept them.
+    def __init__(self, reload: bool = False, precompressed: bool = False) -> None:
+        self.reload = reload
+        self.precompressed = precompressed
+        self._sources: dict[str, tuple[Path, bool]] = {}
+        self._explicit: set[str] = set()
+        self._directories: list[tuple[str, Path]] = []
+        self._entries: dict[str, dict] = {}
+        self._fingerprinted: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def add_file(self, url: str, path: Path, immutable: bool = False) -> None:
+        if path.is_file():
+            self._explicit.add(url)
+            self._sources[url] = (path, immutable)
+            self._index(url)
+
+    def add_directory(self, prefix: str, directory: Path) -> None:
+        self._directories.append((prefix, directory))
+        self._scan(prefix, directory)
+
+    def url_for(self, url: str) -> str:
+        entry = self._entries.get(url)
+        return entry["fingerprinted_url"] if entry else url
+
+    def urls(self) -> dict[str, str]:
+        return {url: entry["fingerprinted_url"] for url, entry in self._entries.items()}
+
+    def respond(self, request: Request, url: str, cache_control: str | None = None) -> Response | None:
+        requested, immutable = url, False
+        if url in self._fingerprinted:
+            url, immutable = self._fingerprinted[url], True
+        entry = self._lookup(url)
+        if entry is None:
+            return None
+        if immutable and entry["fingerprinted_url"] != requested:
+            # The file changed since this hash was issued; its old bytes are gone, so don't cache new ones under it.
+            return None
+        if request.query_params.get("quality") == LOW_BITRATE_QUALITY and entry.get("low_url"):
+            entry = self._lookup(entry["low_url"]) or entry
+        if cache_control is None:
+            cache_control = IMMUTABLE_CACHE if immutable or entry["immutable"] else REVALIDATE_CACHE
+        path, etag = entry["path"], entry["etag"]
+        headers = {"Cache-Control": cache_control}
+        if entry["variants"]:
+            headers["Vary"] = "Accept-Encoding"
+            accepted = accepted_encodings(request)
+            for encoding, _suffix in ENCODINGS:
+                if encoding in accepted and encoding in entry["variants"]:
+                    path = entry["variants"][encoding]
+                    etag = f'{etag[:-1]}-{encoding}"'
+                    headers["Content-Encoding"] = encoding
+                    break
+        headers["ETag"] = etag
+        if if_none_match(request, etag):
+            headers.pop("Content-Encoding", None)
+            return Response(status_code=304, headers=headers)
+        if entry["media"]:
+            return media_response(request, entry, headers)
+        return FileResponse(str(path), media_type=entry["media_type"], headers=headers)
+
+    def _lookup(self, url: str) -> dict | None:
+        entry = self._entries.get(url)
+        if entry is None:
+            if not self.reload:
+                return None
+            # Dev mode: pick up added files without a restart.
+            for prefix, directory in self._directories:
+                self._scan(prefix, directory)
+            return self._entries.get(url)
+        # Files can be rewritten in place while serving (e.g. Pages/data from the scraper), so every lookup
+        # re-stats the source; a change re-hashes it and drops compressed siblings older than the new bytes.
+        try:
+            stat = entry["path"].stat()
+        except OSError:
+            self._drop(url)
+            return None
+        if stat.st_mtime_ns != entry["mtime_ns"] or stat.st_size != entry["size"]:
+            self._index(url)
+        return self._entries.get(url)
+
+    def _scan(self, prefix: str, directory: Path) -> None:
+        if not directory.is_dir():
+            return
+        for path in sorted(directory.rglob("*")):
+            if not path.is_file() or path.name.startswith(".") or path.suffix in {".gz", ".br", ".tmp"}:
+                continue
+            url = f"{prefix}/{path.relative_to(directory).as_posix()}"
+            # Explicitly registered files win over directory entries with the same URL.
+            if url in self._explicit or url in self._entries:
+                continue
+            self._sources[url] = (path, False)
+            self._index(url)
+
+    def _index(self, url: str) -> None:
+        path, immutable = self._sources[url]
+        stat = path.stat()
+        digest = hashlib.sha256()
+        with path.open("rb") as handle:
+            for block in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(block)
+        content_hash = digest.hexdigest()[:16]
+        base, _, name = url.rpartition("/")
+        stem, dot, suffix = name.partition(".")
+        fingerprinted_url = f"{base}/{stem}.{content_hash[:10]}{dot}{suffix}"
+        entry = {
+            "path": path,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "etag": f'"{content_hash}"',
+            "media_type": mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            "immutable": immutable,
+            "fingerprinted_url": fingerprinted_url,
+            "variants": compressed_siblings(path) if self.precompressed and path.suffix in COMPRESSIBLE_SUFFIXES else {},
+            "media": path.suffix in MEDIA_SUFFIXES,
+            "low_url": None,
+        }
+        if entry["media"] and not path.stem.endswith(f".{LOW_BITRATE_QUALITY}"):
+            low_path = low_bitrate_path(path)
+            if low_path.is_file():
+                # Served for ?quality=low; registered as its own entry so it gets its own ETag.
+                entry["low_url"] = f"{base}/{stem}.{LOW_BITRATE_QUALITY}{dot}{suffix}"
+                self._sources.setdefault(entry["low_url"], (low_path, immutable))
+                if entry["low_url"] not in self._entries:
+                    self._index(entry["low_url"])
+        with self._lock:
+            previous = self._entries.get(url)
+            if previous:
+                self._fingerprinted.pop(previous["fingerprinted_url"], None)
+            self._entries[url] = entry
+            self._fingerprinted[fingerprinted_url] = url
+
+    def _drop(self, url: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(url, None)
+            if entry:
+                self._fingerprinted.pop(entry["fingerprinted_url"], None)
+
+
+asset_manifest = AssetManifest()
+page_manifest = AssetManifest(precompressed=True)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class AsyncLRUCache:
+    # LRU + TTL cache capped by entry count and approximate payload bytes.
+    # Entries are tagged with a generation; bumping it invalidates everything cached so far.
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, int, int, Any]] = OrderedDict()
+        self._bytes = 0
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    async def get_or_set(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, generation, _size, value = entry
+            if generation == self.generation and expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self._evict(key)
+        self.misses += 1
+
+        # Concurrent misses for the same key share one computation.
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self.generation
+        try:
+            value = await factory()
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            # A discard() while the factory ran drops our claim; its result must not be cached.
+            owned = self._inflight.get(key) is future
+            if owned:
+                del self._inflight[key]
+        future.set_result(value)
+        if owned and generation == self.generation:
+            self._store(key, value, generation)
+        return value
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+        self._bytes = 0
+
+    def discard(self, key: Hashable) -> None:
+        self._evict(key)
+        self._inflight.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "generation": self.generation,
+        }
+
+    def _store(self, key: Hashable, value: Any, generation: int) -> None:
+        size = len(json.dumps(value, default=str))
+        if size > self.max_bytes:
+            return
+        self._evict(key)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, generation, size, value)
+        self._bytes += size
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._evict(oldest)
+
+    def _evict(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+
+class EpochTTLCache:
+    # Key -> value with a per-entry TTL, for small lookups that are loaded in full rather than sized.
+    # Every discard bumps the epoch; put() drops loads that started under an older epoch, so a read
+    # racing an edit in this process cannot store what it saw before the edit.
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.epoch = 0
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return False, None
+        return True, entry[1]
+
+    def peek(self, key: Hashable) -> Any:
+        # Last stored value even if expired, for callers that can revalidate it cheaply.
+        entry = self._entries.get(key)
+        return entry[1] if entry else None
+
+    def put(self, key: Hashable, value: Any, epoch: int) -> None:
+        if epoch == self.epoch:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def discard(self, key: Hashable) -> None:
+        self.epoch += 1
+        self._entries.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        self.epoch += 1
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
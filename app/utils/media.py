@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from email.utils import formatdate
+from pathlib import Path
+
+import anyio
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+MEDIA_SUFFIXES = {".mp4", ".webm", ".mov", ".m4v", ".mp3", ".ogg"}
+LOW_BITRATE_QUALITY = "low"
+CHUNK_SIZE = 256 * 1024
+
+
+def low_bitrate_path(path: Path) -> Path:
+    # animation.mp4 -> animation.low.mp4, encoded offline next to the original.
+    return path.with_name(f"{path.stem}.{LOW_BITRATE_QUALITY}{path.suffix}")
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    # Single "bytes=" ranges only; anything else (multipart, other units) falls back to the full body.
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        raise ValueError("unsupported range")
+    first, _, last = spec.strip().partition("-")
+    if not first:
+        if not last.isdigit() or int(last) == 0:
+            return None
+        return max(size - int(last), 0), size - 1
+    if not first.isdigit() or (last and not last.isdigit()):
+        raise ValueError("malformed range")
+    start = int(first)
+    if last and int(last) < start:
+        # Invalid rather than unsatisfiable: the header is ignored and the full body is sent.
+        raise ValueError("malformed range")
+    if start >= size:
+        return None
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+class MediaFileResponse(Response):
+    # Streams [start, end] of a file, handing the copy to the server (zerocopysend/pathsend) when it offers one.
+    def __init__(self, path: Path, start: int, end: int, status_code: int, headers: dict, media_type: str) -> None:
+        super().__init__(status_code=status_code, headers=headers, media_type=media_type)
+        self.path = path
+        self.start = start
+        self.length = end - start + 1
+        self.headers["content-length"] = str(self.length)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        extensions = scope.get("extensions") or {}
+        if scope["method"].upper() == "HEAD" or self.length == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif "http.response.zerocopysend" in extensions:
+            with open(self.path, "rb") as handle:
+                await send(
+                    {
+                        "type": "http.response.zerocopysend",
+                        "file": handle,
+                        "offset": self.start,
+                        "count": self.length,
+                        "more_body": False,
+                    }
+                )
+        elif "http.response.pathsend" in extensions and self.status_code == 200:
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+        else:
+            async with await anyio.open_file(self.path, mode="rb") as handle:
+                await handle.seek(self.start)
+                remaining = self.length
+                while remaining > 0:
+                    chunk = await handle.read(min(CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+                if remaining > 0:
+                    # File shrank underneath us; close the body rather than leave the client waiting.
+                    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def media_response(request: Request, entry: dict, headers: dict) -> Response:
+    size = entry["size"]
+    last_modified = formatdate(entry["mtime_ns"] / 1e9, usegmt=True)
+    headers = {**headers, "Accept-Ranges": "bytes", "Last-Modified": last_modified}
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    # A stale If-Range validator means the client's partial copy is outdated: send the whole file.
+    if range_header and if_range and if_range.strip() not in {headers["ETag"], last_modified}:
+        range_header = None
+    full = MediaFileResponse(entry["path"], 0, size - 1, 200, headers, entry["media_type"])
+    if not range_header:
+        return full
+    try:
+        byte_range = parse_range(range_header, size)
+    except ValueError:
+        return full
+    if byte_range is None:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return MediaFileResponse(entry["path"], start, end, 206, headers, entry["media_type"])
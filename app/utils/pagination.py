@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import base64
+import json
+from typing import Any
+
+from app.utils.errors import AppError
+
+
+def encode_cursor(state: dict[str, Any]) -> str:
+    raw = json.dumps(state, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise AppError(400, "invalid_cursor", "Invalid pagination cursor")
+    if not isinstance(state, dict):
+        raise AppError(400, "invalid_cursor", "Invalid pagination cursor")
+    return state
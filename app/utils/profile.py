@@ -18,3 +18,11 @@ def is_capstone_profile_complete(doc: dict | None) -> bool:
         and availability
         and looking_for in {"TEAM", "MEMBER"}
     )
+
+
+def is_discoverable(profile: dict | None, user: dict | None) -> bool:
+    if not profile or not user:
+        return False
+    if user.get("role") in {"ADMIN", "MENTOR"} or user.get("blocked"):
+        return False
+    return is_capstone_profile_complete(profile)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import re
+
+MAX_PREFIX_LENGTH = 15
+
+_TOKEN_SPLIT = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def name_tokens(value: str | None) -> list[str]:
+    return [token for token in _TOKEN_SPLIT.split((value or "").lower()) if token]
+
+
+def name_prefixes(name: str | None) -> list[str]:
+    # Edge n-grams of every word so "ary" or "sha" finds "Aryan Sharma".
+    prefixes: set[str] = set()
+    for token in name_tokens(name):
+        for size in range(1, min(len(token), MAX_PREFIX_LENGTH) + 1):
+            prefixes.add(token[:size])
+    return sorted(prefixes)
+
+
+def query_prefixes(query: str | None) -> list[str]:
+    return sorted({token[:MAX_PREFIX_LENGTH] for token in name_tokens(query)})
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+
+def normalize_skill(skill: str) -> str:
+    return " ".join(str(skill).split()).lower()
+
+
+def normalize_skills(skills: list[str] | None) -> list[str]:
+    normalized: list[str] = []
+    seen: set[str] = set()
+    for skill in skills or []:
+        value = normalize_skill(skill)
+        if value and value not in seen:
+            seen.add(value)
+            normalized.append(value)
+    return normalized
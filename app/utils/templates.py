@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Hashable
+
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+
+class CompiledTemplate:
+    # Static chunks interleaved with slots; a slot without a context value renders as its literal placeholder.
+    __slots__ = ("_parts", "_slots")
+
+    def __init__(self, source: str) -> None:
+        parts: list[str] = []
+        slots: list[tuple[int, str]] = []
+        last = 0
+        for match in _PLACEHOLDER.finditer(source):
+            parts.append(source[last:match.start()])
+            slots.append((len(parts), match.group(1)))
+            parts.append(match.group(0))
+            last = match.end()
+        parts.append(source[last:])
+        self._parts = parts
+        self._slots = slots
+
+    def render(self, context: dict[str, str]) -> str:
+        parts = self._parts.copy()
+        for position, name in self._slots:
+            value = context.get(name)
+            if value is not None:
+                parts[position] = value
+        return "".join(parts)
+
+
+class TemplateCache:
+    # Compiled templates keyed by file path + mtime, or by caller key + version (e.g. a DB updated_at).
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[Hashable, CompiledTemplate]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def from_file(self, path: Path) -> CompiledTemplate:
+        version = path.stat().st_mtime_ns
+        compiled = self._lookup(path, version)
+        if compiled is None:
+            compiled = self._store(path, version, CompiledTemplate(path.read_text(encoding="utf-8")))
+        return compiled
+
+    def from_source(self, key: Hashable, version: Hashable, source: str) -> CompiledTemplate:
+        compiled = self._lookup(key, version)
+        if compiled is None:
+            compiled = self._store(key, version, CompiledTemplate(source))
+        return compiled
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _lookup(self, key: Hashable, version: Hashable) -> CompiledTemplate | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def _store(self, key: Hashable, version: Hashable, compiled: CompiledTemplate) -> CompiledTemplate:
+        with self._lock:
+            self._entries[key] = (version, compiled)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compiled
+
+
+template_cache = TemplateCache()
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from app.utils.assets import COMPRESSIBLE_SUFFIXES, precompress
+
+
+def main() -> None:
+    pages_dir = ROOT / "Pages"
+    for path in sorted(pages_dir.rglob("*")):
+        if path.is_file() and path.suffix in COMPRESSIBLE_SUFFIXES:
+            variants = precompress(path)
+            print(f"{path.relative_to(ROOT)}: {', '.join(sorted(variants)) or 'skipped'}")
+
+
+if __name__ == "__main__":
+    main()
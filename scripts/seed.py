@@ -12,6 +12,9 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT))
 
 from app.core.config import settings
+from app.services.profile_events import profile_changed
+from app.utils.search import name_prefixes
+from app.utils.skills import normalize_skills
 
 
 SEED_TARGET = 1
@@ -113,7 +116,13 @@ async def upsert_user(db, user: dict) -> ObjectId:
     await db.users.update_one(
         {"email": user["email"]},
         {
-            "$set": {"name": user["name"], "role": user["role"], "last_login": now, "role_selected": True},
+            "$set": {
+                "name": user["name"],
+                "name_prefixes": name_prefixes(user["name"]),
+                "role": user["role"],
+                "last_login": now,
+                "role_selected": True,
+            },
             "$setOnInsert": {"created_at": now},
         },
         upsert=True,
@@ -123,11 +132,16 @@ async def upsert_user(db, user: dict) -> ObjectId:
 
 
 async def upsert_capstone(db, user_id: ObjectId, profile: dict) -> None:
+    normalized = {
+        "skills_norm": normalize_skills(profile.get("skills")),
+        "required_skills_norm": normalize_skills(profile.get("required_skills")),
+    }
     await db.capstone_profiles.update_one(
         {"user_id": user_id},
-        {"$set": {"user_id": user_id, **profile}},
+        {"$set": {"user_id": user_id, **profile, **normalized}},
         upsert=True,
     )
+    await profile_changed(db, user_id)
 
 
 async def upsert_mentor(db, user_id: ObjectId, profile: dict) -> None: